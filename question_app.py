@@ -9,13 +9,19 @@ import random
 import io
 import os
 import sys
-import tempfile
 import logging
 import hashlib
 import re
+import posixpath
+import zipfile
+import bisect
 from pathlib import Path
 from PIL import Image, ImageQt
-from functools import lru_cache
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import accumulate
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -26,7 +32,7 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import (
     Qt, QSize, pyqtSignal, QTranslator, QLocale, QThread,
-    QSettings
+    QSettings, QTimer, QSignalBlocker, QObject
 )
 from PyQt5.QtGui import (
     QPixmap, QFont, QDragEnterEvent, QDropEvent, QImage,
@@ -35,7 +41,28 @@ from PyQt5.QtGui import (
 
 from docx import Document
 from docx.shared import Inches, Pt, Cm
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+from docx.enum.text import WD_PARAGRAPH_ALIGNMENT, WD_BREAK
+from docx.oxml import OxmlElement
+from docx.text.paragraph import Paragraph
+from lxml import etree
+
+# Необязательное ускорение: xxhash заметно быстрее криптографических хэшей
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# pybase64 кодирует base64 с SIMD; без него используем стандартный модуль
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+# orjson сериализует большие base64-строки в разы быстрее модуля json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Настройка логирования
 logging.basicConfig(
@@ -48,74 +75,387 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# Маркеры SOFn в JPEG, в которых записаны размеры кадра
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Сигнатуры PNG, JPEG, GIF и BMP – форматов, которые не нужно конвертировать
+_SUPPORTED_IMAGE_SIGNATURES = (_PNG_SIGNATURE, b'\xff\xd8\xff', b'GIF87a', b'GIF89a', b'BM')
+# Из них уже сжаты все, кроме BMP: повторный deflate им ничего не дает
+_COMPRESSED_IMAGE_SIGNATURES = _SUPPORTED_IMAGE_SIGNATURES[:4]
+
+# Картинки абзаца: a:blip внутри w:drawing; выражение компилируется один раз
+_BLIP_XPATH = etree.XPath(
+    './/w:drawing//a:blip',
+    namespaces={
+        'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main',
+        'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    }
+)
+_EMBED_ATTR = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed'
+
+# Маркеры границ вопроса: один поиск на параграф вместо двух проверок `in`
+_MARKER_RE = re.compile(r'---(START|END)---')
+
+# Потоковое чтение DOCX: только основной XML документа, связи и нужные картинки
+_W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_W_P = f'{{{_W_NS}}}p'
+_W_BODY = f'{{{_W_NS}}}body'
+_W_T = f'{{{_W_NS}}}t'
+_W_BR = f'{{{_W_NS}}}br'
+_W_BR_TYPE = f'{{{_W_NS}}}type'
+# Содержимое прогонов абзаца, в том числе внутри гиперссылок, в порядке документа
+_RUN_CONTENT_XPATH = etree.XPath('./w:r/* | ./w:hyperlink/w:r/*', namespaces={'w': _W_NS})
+# Текстовые эквиваленты служебных элементов прогона – как в python-docx
+_RUN_CONTENT_TEXT = {
+    f'{{{_W_NS}}}tab': '\t',
+    f'{{{_W_NS}}}ptab': '\t',
+    f'{{{_W_NS}}}cr': '\n',
+    f'{{{_W_NS}}}noBreakHyphen': '-',
+}
+
+
+def paragraph_text(p):
+    """Текст абзаца w:p по тем же правилам, что и Paragraph.text в python-docx."""
+    parts = []
+    for el in _RUN_CONTENT_XPATH(p):
+        tag = el.tag
+        if tag == _W_T:
+            parts.append(el.text or '')
+        elif tag == _W_BR:
+            # Разрывы страницы и колонки текста не дают
+            if el.get(_W_BR_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        else:
+            parts.append(_RUN_CONTENT_TEXT.get(tag, ''))
+    return ''.join(parts)
+
+
+def save_docx(doc, path):
+    """Сохраняет документ, записывая уже сжатые картинки без deflate.
+    
+    python-docx сжимает все части пакета, включая PNG/JPEG/GIF, которым
+    повторное сжатие ничего не дает. Поэтому пакет собирается в памяти и
+    переписывается в файл: такие картинки – без сжатия, остальное – как было.
+    """
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    with zipfile.ZipFile(buffer) as src, \
+            zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as dst:
+        for name in src.namelist():
+            data = src.read(name)
+            if data.startswith(_COMPRESSED_IMAGE_SIGNATURES):
+                dst.writestr(name, data, compress_type=zipfile.ZIP_STORED)
+            else:
+                dst.writestr(name, data)
+
+
+def read_part_rels(zf, part_name, rel_type=None):
+    """Возвращает внутренние связи части пакета: rId -> путь внутри zip."""
+    folder, name = posixpath.split(part_name)
+    try:
+        data = zf.read(posixpath.join(folder, '_rels', name + '.rels'))
+    except KeyError:
+        return {}
+    
+    rels = {}
+    for rel in etree.fromstring(data):
+        if rel.get('TargetMode') == 'External':
+            continue
+        if rel_type and not rel.get('Type', '').endswith(rel_type):
+            continue
+        target = rel.get('Target', '')
+        if target.startswith('/'):
+            rels[rel.get('Id')] = target[1:]
+        else:
+            rels[rel.get('Id')] = posixpath.normpath(posixpath.join(folder, target))
+    return rels
+
+
+def main_document_part(zf):
+    """Путь к основному XML документа внутри DOCX."""
+    parts = read_part_rels(zf, '', '/officeDocument')
+    return next(iter(parts.values()), 'word/document.xml')
+
+
+def iter_body_paragraphs(zf, part_name):
+    """Потоково отдает абзацы верхнего уровня документа (как doc.paragraphs).
+    
+    Обработанные абзацы и все, что стоит перед ними, сразу удаляются из
+    дерева, поэтому в памяти держится только текущий фрагмент XML.
+    """
+    with zf.open(part_name) as f:
+        for _, p in etree.iterparse(f, events=('end',), tag=_W_P, resolve_entities=False):
+            body = p.getparent()
+            # Абзацы таблиц и надписей освободятся вместе со своим родителем
+            if body is None or body.tag != _W_BODY:
+                continue
+            yield p
+            p.clear()
+            while p.getprevious() is not None:
+                del body[0]
+
+
+def question_parts(question):
+    """Возвращает текст вопроса, разбитый по маркерам [BILD] (один раз на вопрос)."""
+    parts = question.get('_parts')
+    if parts is None:
+        parts = question['_parts'] = question['text'].split('[BILD]')
+    return parts
+
+
+def peek_image_size(img_bytes):
+    """Читает (ширина, высота) из заголовка PNG или JPEG без декодирования.
+    
+    Для остальных форматов и поврежденных заголовков возвращает None.
+    """
+    if img_bytes[:8] == _PNG_SIGNATURE and img_bytes[12:16] == b'IHDR':
+        return (int.from_bytes(img_bytes[16:20], 'big'),
+                int.from_bytes(img_bytes[20:24], 'big'))
+    
+    if img_bytes[:2] == b'\xff\xd8':
+        pos = 2
+        size = len(img_bytes)
+        while pos + 4 <= size:
+            if img_bytes[pos] != 0xFF:
+                return None
+            marker = img_bytes[pos + 1]
+            if marker == 0xFF:  # Байт-заполнитель
+                pos += 1
+                continue
+            if marker == 0x01 or 0xD0 <= marker <= 0xD7:  # Маркеры без длины
+                pos += 2
+                continue
+            if marker in _JPEG_SOF_MARKERS:
+                if pos + 9 > size:
+                    return None
+                return (int.from_bytes(img_bytes[pos + 7:pos + 9], 'big'),
+                        int.from_bytes(img_bytes[pos + 5:pos + 7], 'big'))
+            pos += 2 + int.from_bytes(img_bytes[pos + 2:pos + 4], 'big')
+    
+    return None
+
+
+# Приблизительная высота строки текста в списке вопросов, пиксели
+ESTIMATED_LINE_HEIGHT = 18
+
+
+def question_display_height(question):
+    """Оценивает высоту вопроса в списке без создания виджетов и декодирования.
+    
+    Картинки считаются по заголовку, уменьшенными до 600x400, как в превью.
+    Результат запоминается в вопросе.
+    """
+    height = question.get('_display_h')
+    if height is None:
+        height = (question['text'].count('\n') + 1) * ESTIMATED_LINE_HEIGHT
+        for img_bytes in question['images']:
+            size = peek_image_size(img_bytes)
+            if size is None or not size[0] or not size[1]:
+                height += 200
+            else:
+                w, h = size
+                height += int(min(h, 400, h * 600 / w)) + 20
+        question['_display_h'] = height
+    return height
+
+
+class ImageDecodeSignals(QObject):
+    """Сигнал, которым фоновое декодирование возвращает QImage в поток интерфейса."""
+    
+    decoded = pyqtSignal(object, object)  # ключ кэша, QImage или None
+
 
 class ImageCache:
     """Класс для кэширования и управления изображениями."""
     
+    MAX_ENTRIES = 512
+    # Предел памяти под готовые QPixmap (как лимит QPixmapCache): 512 картинок
+    # 600x400 заняли бы почти 500 МБ
+    MAX_BYTES = 64 * 1024 * 1024
+    
     def __init__(self):
-        self.cache = {}
-        self.hash_cache = {}
-        
-    def get_image_hash(self, img_bytes):
-        """Получает хэш изображения для использования в качестве ключа кэша."""
-        return hashlib.md5(img_bytes).hexdigest()
+        self.cache = OrderedDict()
+        self._cache_bytes = 0
+        # id(bytes) -> (bytes, хэш): повторно переданный тот же объект не хэшируется.
+        # Ссылка на сам объект не дает id быть переиспользованным другим объектом.
+        self._id_to_hash = {}
+        # Декодирование при прокрутке: один пул потоков на все время работы,
+        # QPixmap из готового QImage создается в потоке интерфейса по сигналу
+        self._decode_executor = None
+        self._decode_waiters = {}
+        self._decode_signals = ImageDecodeSignals()
+        self._decode_signals.decoded.connect(self._on_decoded, Qt.QueuedConnection)
+        
+    @staticmethod
+    def get_image_hash(img_bytes):
+        """Получает хэш изображения для использования в качестве ключа кэша.
+
+        Хэш нужен только для дедупликации, поэтому криптостойкость не важна:
+        используем xxh3, а без xxhash – blake2b из стандартной библиотеки.
+        """
+        if xxhash is not None:
+            return xxhash.xxh3_128(img_bytes).hexdigest()
+        return hashlib.blake2b(img_bytes, digest_size=16).hexdigest()
     
-    @lru_cache(maxsize=100)
     def get_scaled_pixmap(self, img_hash, max_width=600, max_height=400):
-        """Возвращает масштабированное изображение из кэша."""
-        if img_hash in self.cache:
-            return self.cache[img_hash]
+        """Возвращает масштабированное изображение из кэша.
+        
+        Ключ – хэш вместе с размерами: одна картинка в разных размерах
+        хранится отдельными записями.
+        """
+        key = (img_hash, max_width, max_height)
+        pixmap = self.cache.get(key)
+        if pixmap is not None:
+            self.cache.move_to_end(key)
+        return pixmap
+    
+    def _hash_for(self, img_bytes):
+        """Возвращает хэш изображения, не пересчитывая его для того же объекта."""
+        entry = self._id_to_hash.get(id(img_bytes))
+        if entry is not None and entry[0] is img_bytes:
+            return entry[1]
+        img_hash = self.get_image_hash(img_bytes)
+        self._id_to_hash[id(img_bytes)] = (img_bytes, img_hash)
+        return img_hash
+    
+    def _decode_scaled(self, img_bytes, max_width, max_height):
+        """Декодирует и уменьшает изображение в QImage (можно вызывать из потоков)."""
+        # Qt сам декодирует PNG/JPEG/GIF/BMP и масштабирует без копий через PIL
+        qimage = QImage.fromData(img_bytes)
+        if qimage.isNull():
+            qimage = self._load_with_pil(img_bytes)
+        
+        # Масштабируем изображение с сохранением пропорций
+        if qimage.width() > max_width or qimage.height() > max_height:
+            qimage = qimage.scaled(max_width, max_height,
+                                   Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return qimage
+    
+    @staticmethod
+    def _pixmap_bytes(image):
+        """Примерный объем памяти QPixmap/QImage в байтах."""
+        return image.width() * image.height() * image.depth() // 8
+    
+    def _store(self, key, qimage):
+        """Кладет готовое изображение в кэш, вытесняя самые старые записи."""
+        pixmap = QPixmap.fromImage(qimage)
+        self.cache[key] = pixmap
+        self._cache_bytes += self._pixmap_bytes(pixmap)
+        
+        # Вытесняем самые давно использованные изображения (только что
+        # добавленное остается, даже если одно превышает предел)
+        while len(self.cache) > 1 and (len(self.cache) > self.MAX_ENTRIES
+                                       or self._cache_bytes > self.MAX_BYTES):
+            _, old_pixmap = self.cache.popitem(last=False)
+            self._cache_bytes -= self._pixmap_bytes(old_pixmap)
+        return pixmap
+    
+    def request_scaled_pixmap(self, img_bytes, callback, max_width=600, max_height=400):
+        """Возвращает изображение из кэша или ставит его декодирование в фон.
+        
+        Если картинки нет в кэше, возвращает None, а callback(pixmap) будет
+        вызван в потоке интерфейса, когда она декодируется (None при ошибке).
+        """
+        key = (self._hash_for(img_bytes), max_width, max_height)
+        cached = self.get_scaled_pixmap(*key)
+        if cached is not None:
+            return cached
+        
+        waiters = self._decode_waiters.get(key)
+        if waiters is not None:
+            # Та же картинка уже декодируется – ждем общий результат
+            waiters.append(callback)
+            return None
+        self._decode_waiters[key] = [callback]
+        if self._decode_executor is None:
+            self._decode_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self._decode_executor.submit(self._decode_in_background, key, img_bytes)
         return None
     
-    def scale_and_cache_image(self, img_bytes, max_width=600, max_height=400):
-        """Масштабирует и кэширует изображение."""
-        img_hash = self.get_image_hash(img_bytes)
-        
-        # Проверяем кэш
-        cached = self.get_scaled_pixmap(img_hash, max_width, max_height)
-        if cached:
-            return cached, img_hash
-        
+    def _decode_in_background(self, key, img_bytes):
+        """Декодирует картинку в потоке пула и отправляет результат сигналом."""
         try:
-            # Загружаем изображение через PIL
-            image = Image.open(io.BytesIO(img_bytes))
-            
-            # Конвертируем в RGB если нужно
-            if image.mode not in ['RGB', 'RGBA']:
-                image = image.convert('RGB')
-            
-            # Масштабируем изображение с сохранением пропорций
-            width, height = image.size
-            if width > max_width or height > max_height:
-                ratio = min(max_width/width, max_height/height)
-                new_size = (int(width * ratio), int(height * ratio))
-                image = image.resize(new_size, Image.Resampling.LANCZOS)
-            
-            # Конвертируем PIL Image в QImage
-            if image.mode == "RGB":
-                qimage = QImage(image.tobytes(), image.size[0], image.size[1], 
-                               image.size[0] * 3, QImage.Format_RGB888)
-            elif image.mode == "RGBA":
-                qimage = QImage(image.tobytes(), image.size[0], image.size[1],
-                               image.size[0] * 4, QImage.Format_RGBA8888)
-            
-            pixmap = QPixmap.fromImage(qimage)
-            
-            # Кэшируем
-            self.cache[img_hash] = pixmap
-            self.hash_cache[img_hash] = img_bytes
-            
-            return pixmap, img_hash
-            
+            qimage = self._decode_scaled(img_bytes, key[1], key[2])
         except Exception as e:
             logger.error(f"Ошибка обработки изображения: {str(e)}")
-            return None, None
+            qimage = None
+        self._decode_signals.decoded.emit(key, qimage)
+    
+    def _on_decoded(self, key, qimage):
+        """Кладет декодированную в фоне картинку в кэш и отдает ее ожидающим."""
+        pixmap = None
+        if qimage is not None and not qimage.isNull():
+            pixmap = self._store(key, qimage)
+        for callback in self._decode_waiters.pop(key, ()):
+            callback(pixmap)
+    
+    def prefetch(self, images, max_width=600, max_height=400, progress_callback=None):
+        """Параллельно декодирует и уменьшает изображения до создания виджетов.
+        
+        Декодирование и масштабирование QImage/PIL идут в пуле потоков, а
+        QPixmap создается только в основном потоке, как того требует Qt.
+        За один вызов кладется не больше MAX_ENTRIES записей и MAX_BYTES
+        памяти, чтобы не вытеснять свои же: картинки первых вопросов нужны
+        раньше всего. Записи прошлых загрузок при этом вытесняются как обычно,
+        по давности использования.
+        """
+        pending = {}
+        for img_bytes in images:
+            if len(pending) >= self.MAX_ENTRIES:
+                break
+            img_hash = self._hash_for(img_bytes)
+            if (img_hash, max_width, max_height) not in self.cache and img_hash not in pending:
+                pending[img_hash] = img_bytes
+        if not pending:
+            return
+        
+        def decode(item):
+            img_hash, img_bytes = item
+            try:
+                return img_hash, self._decode_scaled(img_bytes, max_width, max_height)
+            except Exception:
+                # Ошибку залогирует декодирование при создании виджета
+                return img_hash, None
+        
+        # Объем, положенный этим вызовом: старые записи в бюджет не входят
+        stored_bytes = 0
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for done, (img_hash, qimage) in enumerate(
+                    executor.map(decode, pending.items()), 1):
+                if qimage is not None and not qimage.isNull():
+                    size = self._pixmap_bytes(qimage)
+                    # Бюджет исчерпан – остальные картинки декодируются при прокрутке
+                    if stored_bytes + size > self.MAX_BYTES:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+                    self._store((img_hash, max_width, max_height), qimage)
+                    stored_bytes += size
+                if progress_callback:
+                    progress_callback(done, len(pending))
+    
+    def _load_with_pil(self, img_bytes):
+        """Декодирует через PIL форматы, которые Qt не умеет открывать."""
+        image = Image.open(io.BytesIO(img_bytes))
+        
+        # Всегда 4 байта на пиксель: строки выровнены, и Qt не приходится
+        # расширять RGB888 до 32 бит при каждой отрисовке. RGB упаковывается
+        # в RGBX прямо в tobytes(), без отдельного convert()
+        if image.mode == 'RGB':
+            data, fmt = image.tobytes('raw', 'RGBX'), QImage.Format_RGBX8888
+        else:
+            if image.mode != 'RGBA':
+                image = image.convert('RGBA')
+            data, fmt = image.tobytes(), QImage.Format_RGBA8888
+        
+        # Конвертируем PIL Image в QImage
+        qimage = QImage(data, image.size[0], image.size[1], image.size[0] * 4, fmt)
+        
+        # copy() отвязывает QImage от временного буфера tobytes()
+        return qimage.copy()
     
-    def clear_cache(self):
-        """Очищает кэш изображений."""
-        self.cache.clear()
-        self.hash_cache.clear()
-        self.get_scaled_pixmap.cache_clear()
+    def forget_sources(self):
+        """Забывает объекты bytes, по которым уже считались хэши."""
+        self._id_to_hash.clear()
 
 
 class ThemeManager:
@@ -176,65 +516,31 @@ class ThemeManager:
         }
     }
     
-    def __init__(self):
-        self.current_theme = 'light'
-        
-    def get_theme(self, theme_name=None):
-        """Возвращает словарь с цветами темы."""
-        if theme_name is None:
-            theme_name = self.current_theme
-        return self.themes.get(theme_name, self.themes['light'])
-    
-    def apply_theme(self, theme_name, app):
-        """Применяет тему к приложению."""
-        self.current_theme = theme_name
-        theme = self.get_theme(theme_name)
-        
-        # Создаем палитру для приложения
-        palette = QPalette()
-        
-        # Базовые цвета
-        palette.setColor(QPalette.Window, QColor(theme['primary_bg']))
-        palette.setColor(QPalette.WindowText, QColor(theme['primary_text']))
-        palette.setColor(QPalette.Base, QColor(theme['secondary_bg']))
-        palette.setColor(QPalette.AlternateBase, QColor(theme['tertiary_bg']))
-        palette.setColor(QPalette.ToolTipBase, QColor(theme['primary_bg']))
-        palette.setColor(QPalette.ToolTipText, QColor(theme['primary_text']))
-        palette.setColor(QPalette.Text, QColor(theme['primary_text']))
-        palette.setColor(QPalette.Button, QColor(theme['secondary_bg']))
-        palette.setColor(QPalette.ButtonText, QColor(theme['primary_text']))
-        palette.setColor(QPalette.BrightText, QColor(theme['accent']))
-        palette.setColor(QPalette.Link, QColor(theme['accent']))
-        palette.setColor(QPalette.Highlight, QColor(theme['accent']))
-        palette.setColor(QPalette.HighlightedText, QColor(theme['primary_bg']))
-        
-        app.setPalette(palette)
-        
-        # Стили для виджетов
-        style_sheet = f"""
+    # Шаблон общей таблицы стилей; подставляется в цвета каждой темы
+    _STYLE_TEMPLATE = """
             QMainWindow, QWidget {{
-                background-color: {theme['primary_bg']};
-                color: {theme['primary_text']};
+                background-color: {primary_bg};
+                color: {primary_text};
             }}
             
             QGroupBox {{
                 font-weight: bold;
-                border: 2px solid {theme['border']};
+                border: 2px solid {border};
                 border-radius: 5px;
                 margin-top: 10px;
                 padding-top: 10px;
-                background-color: {theme['secondary_bg']};
+                background-color: {secondary_bg};
             }}
             
             QGroupBox::title {{
                 subcontrol-origin: margin;
                 left: 10px;
                 padding: 0 5px 0 5px;
-                color: {theme['primary_text']};
+                color: {primary_text};
             }}
             
             QPushButton {{
-                background-color: {theme['button_bg']};
+                background-color: {button_bg};
                 color: white;
                 border: none;
                 padding: 8px;
@@ -243,50 +549,50 @@ class ThemeManager:
             }}
             
             QPushButton:hover {{
-                background-color: {theme['button_hover']};
+                background-color: {button_hover};
             }}
             
             QPushButton:pressed {{
-                background-color: {theme['accent_hover']};
+                background-color: {accent_hover};
             }}
             
             QCheckBox {{
                 spacing: 5px;
-                color: {theme['primary_text']};
+                color: {primary_text};
             }}
             
             QCheckBox::indicator {{
                 width: 20px;
                 height: 20px;
-                border: 2px solid {theme['checkbox_border']};
+                border: 2px solid {checkbox_border};
                 border-radius: 3px;
-                background: {theme['primary_bg']};
+                background: {primary_bg};
             }}
             
             QCheckBox::indicator:checked {{
-                background-color: {theme['accent']};
-                border: 2px solid {theme['accent']};
+                background-color: {accent};
+                border: 2px solid {accent};
             }}
             
             QScrollArea {{
                 border: none;
-                background-color: {theme['primary_bg']};
+                background-color: {primary_bg};
             }}
             
             QScrollBar:vertical {{
-                background-color: {theme['scrollbar_bg']};
+                background-color: {scrollbar_bg};
                 width: 12px;
                 margin: 0px;
             }}
             
             QScrollBar::handle:vertical {{
-                background-color: {theme['scrollbar_handle']};
+                background-color: {scrollbar_handle};
                 min-height: 20px;
                 border-radius: 6px;
             }}
             
             QScrollBar::handle:vertical:hover {{
-                background-color: {theme['accent']};
+                background-color: {accent};
             }}
             
             QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
@@ -294,61 +600,169 @@ class ThemeManager:
             }}
             
             QLineEdit, QComboBox, QSpinBox {{
-                border: 1px solid {theme['border']};
+                border: 1px solid {border};
                 border-radius: 4px;
                 padding: 5px;
-                background-color: {theme['primary_bg']};
-                color: {theme['primary_text']};
+                background-color: {primary_bg};
+                color: {primary_text};
             }}
             
             QLineEdit:focus, QComboBox:focus, QSpinBox:focus {{
-                border: 2px solid {theme['accent']};
+                border: 2px solid {accent};
             }}
             
             QProgressBar {{
-                border: 1px solid {theme['border']};
+                border: 1px solid {border};
                 border-radius: 4px;
                 text-align: center;
-                background-color: {theme['secondary_bg']};
+                background-color: {secondary_bg};
             }}
             
             QProgressBar::chunk {{
-                background-color: {theme['accent']};
+                background-color: {accent};
                 border-radius: 4px;
             }}
             
             QRadioButton {{
-                color: {theme['primary_text']};
+                color: {primary_text};
                 spacing: 5px;
             }}
             
             QLabel {{
-                color: {theme['primary_text']};
+                color: {primary_text};
             }}
             
             QFrame[frameShape="4"] {{  /* HLine */
-                color: {theme['separator_color']};
-                background-color: {theme['separator_color']};
+                color: {separator_color};
+                background-color: {separator_color};
+            }}
+            
+            /* Карточки вопросов: выбор переключает свойство selected */
+            ClickableQuestionWidget {{
+                border: 1px solid transparent;
+                border-radius: 5px;
+            }}
+            
+            ClickableQuestionWidget:hover {{
+                background-color: {hover_bg};
+                border-color: {accent};
+            }}
+            
+            ClickableQuestionWidget[selected="true"] {{
+                background-color: {selected_bg};
+                border: 2px solid {accent};
+            }}
+            
+            ClickableQuestionWidget[selected="true"]:hover {{
+                background-color: {hover_bg};
             }}
         """
+    
+    def __init__(self):
+        self.current_theme = 'light'
+        
+    def get_theme(self, theme_name=None):
+        """Возвращает словарь с цветами темы."""
+        if theme_name is None:
+            theme_name = self.current_theme
+        return self.themes.get(theme_name, self.themes['light'])
+    
+    def apply_theme(self, theme_name, app):
+        """Применяет тему к приложению."""
+        self.current_theme = theme_name
+        theme = self.get_theme(theme_name)
+        
+        # Создаем палитру для приложения
+        palette = QPalette()
+        
+        # Базовые цвета
+        palette.setColor(QPalette.Window, QColor(theme['primary_bg']))
+        palette.setColor(QPalette.WindowText, QColor(theme['primary_text']))
+        palette.setColor(QPalette.Base, QColor(theme['secondary_bg']))
+        palette.setColor(QPalette.AlternateBase, QColor(theme['tertiary_bg']))
+        palette.setColor(QPalette.ToolTipBase, QColor(theme['primary_bg']))
+        palette.setColor(QPalette.ToolTipText, QColor(theme['primary_text']))
+        palette.setColor(QPalette.Text, QColor(theme['primary_text']))
+        palette.setColor(QPalette.Button, QColor(theme['secondary_bg']))
+        palette.setColor(QPalette.ButtonText, QColor(theme['primary_text']))
+        palette.setColor(QPalette.BrightText, QColor(theme['accent']))
+        palette.setColor(QPalette.Link, QColor(theme['accent']))
+        palette.setColor(QPalette.Highlight, QColor(theme['accent']))
+        palette.setColor(QPalette.HighlightedText, QColor(theme['primary_bg']))
+        
+        app.setPalette(palette)
+        
+        # Стили для виджетов: готовая строка, собранная один раз при импорте
+        style_sheet = self._COMPILED_STYLES.get(theme_name, self._COMPILED_STYLES['light'])
         
         app.setStyleSheet(style_sheet)
         
         return style_sheet
 
 
+# Таблицы стилей для всех тем форматируются один раз при импорте
+ThemeManager._COMPILED_STYLES = {
+    name: ThemeManager._STYLE_TEMPLATE.format(**theme)
+    for name, theme in ThemeManager.themes.items()
+}
+
+
+class LoadWorker(QThread):
+    """Поток для чтения и разбора DOCX в фоновом режиме."""
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(list)
+    error = pyqtSignal(str)
+    
+    def __init__(self, file_path, parse_func):
+        super().__init__()
+        self.file_path = file_path
+        self.parse_func = parse_func
+    
+    def run(self):
+        try:
+            self.progress.emit(20)
+            
+            # parse_func сам читает файл и проверяет isInterruptionRequested между абзацами
+            questions = self.parse_func(self.file_path)
+            if self.isInterruptionRequested():
+                return
+            self.progress.emit(60)
+            self.finished.emit(questions)
+            
+        except Exception as e:
+            logger.error(f"Ошибка загрузки файла: {str(e)}")
+            self.error.emit(str(e))
+
+
 class ExportWorker(QThread):
     """Поток для экспорта в фоновом режиме."""
     progress = pyqtSignal(int)
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
     
+    # "Aufgabe XX" в тексте вопроса; компилируется один раз для всех экспортов.
+    # Замену передаем функцией: строковый шаблон с новым номером разбирался бы
+    # заново для каждого вопроса
+    _AUFGABE_RE = re.compile(r'(Aufgabe\s+)(\d+)', re.IGNORECASE)
+    
     def __init__(self, questions, export_format, export_path, export_options):
         super().__init__()
         self.questions = questions
         self.export_format = export_format
         self.export_path = export_path
         self.export_options = export_options
+        # (id вопроса, позиция или None) -> (текст, части); вопросы хранятся
+        # в self.questions, поэтому их id не переиспользуются
+        self._text_cache = {}
+        # (хэш, макс. высота) -> PNG; LANCZOS выполняется раз на картинку
+        self._resized_image_cache = {}
+        # (хэш, макс. высота) -> base64 того же PNG
+        self._b64_cache = {}
+        # хэш изображения -> (ImageReader, ширина, высота) для PDF
+        self._pdf_image_cache = {}
+        # Знаменатель прогресса считаем один раз; max – защита от пустого списка
+        self._total = max(len(questions), 1)
+        self._last_pct = -1
         
     def run(self):
         try:
@@ -369,6 +783,148 @@ class ExportWorker(QThread):
             logger.error(f"Ошибка экспорта: {str(e)}")
             self.error.emit(str(e))
     
+    def _emit_progress(self, done):
+        """Сообщает прогресс только при смене процента, а не на каждый вопрос."""
+        pct = done * 100 // self._total
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.progress.emit(pct)
+    
+    def _question_text(self, question, idx):
+        """Возвращает (текст, части по [BILD]) вопроса с учетом нумерации.
+        
+        Результат запоминается в самом экспорте, а не в вопросе: словари
+        вопросов принадлежат интерфейсу, и поток экспорта в них не пишет.
+        """
+        sequential = self.export_options.get('numbering') == 'sequential'
+        key = (id(question), idx if sequential else None)
+        cached = self._text_cache.get(key)
+        if cached is None:
+            if sequential:
+                # Ищем и заменяем "Aufgabe XX" на "Aufgabe [номер]"
+                new_number = str(idx + 1)
+                question_text = self._AUFGABE_RE.sub(lambda m: m.group(1) + new_number, question['text'])
+                cached = (question_text, question_text.split('[BILD]'))
+            else:
+                # Части, уже разобранные интерфейсом, только читаем
+                parts = question.get('_parts')
+                if parts is None:
+                    parts = question['text'].split('[BILD]')
+                cached = (question['text'], parts)
+            self._text_cache[key] = cached
+        return cached
+    
+    @staticmethod
+    def _resize_image(img_bytes, max_height):
+        """Открывает изображение и уменьшает его до max_height пикселей (PIL Image)."""
+        img = Image.open(io.BytesIO(img_bytes))
+        if img.height <= max_height:
+            return img
+        
+        # JPEG декодируется сразу уменьшенным в 2/4/8 раз (DCT-масштаб), но не
+        # меньше чем вдвое больше нужного; для остальных форматов draft ничего не делает
+        target_width = max(1, img.width * max_height // img.height)
+        img.draft(None, (target_width * 2, max_height * 2))
+        
+        # Уменьшаем до допустимой высоты; thumbnail сам сохраняет пропорции.
+        # reducing_gap: сначала быстрое уменьшение блоками, LANCZOS – на малом размере
+        img.thumbnail((img.width, max_height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        return img
+    
+    def _get_resized_image(self, img_bytes, max_height, key=None):
+        """Возвращает PNG не выше max_height пикселей, кэшируя результат."""
+        if key is None:
+            key = (ImageCache.get_image_hash(img_bytes), max_height)
+        encoded = self._resized_image_cache.get(key)
+        if encoded is not None:
+            return encoded
+        
+        # PNG, который и так помещается, отдаем как есть, без декодирования
+        if img_bytes[:8] == _PNG_SIGNATURE:
+            size = peek_image_size(img_bytes)
+            if size is not None and size[1] <= max_height:
+                self._resized_image_cache[key] = img_bytes
+                return img_bytes
+        
+        img = self._resize_image(img_bytes, max_height)
+        
+        img_buffer = io.BytesIO()
+        img.save(img_buffer, format='PNG')
+        encoded = img_buffer.getvalue()
+        
+        self._resized_image_cache[key] = encoded
+        return encoded
+    
+    def _prefetch_images(self, max_height, with_base64=False, for_pdf=False):
+        """Параллельно уменьшает и кодирует все изображения, заполняя кэши.
+        
+        PIL и base64 отпускают GIL, поэтому потоки действительно работают
+        одновременно. Основной цикл экспорта затем только читает кэш.
+        При for_pdf заполняется кэш ImageReader вместо PNG.
+        """
+        unique_images = {id(img): img for q in self.questions for img in q['images']}
+        if len(unique_images) < 2:
+            return
+        
+        def prepare(img_bytes):
+            try:
+                if for_pdf:
+                    self._get_pdf_image(img_bytes, max_height)
+                    return
+                if with_base64:
+                    self._get_base64(img_bytes, max_height)
+                else:
+                    self._get_resized_image(img_bytes, max_height)
+            except Exception:
+                # Ошибку залогирует основной цикл при повторной попытке
+                pass
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(prepare, unique_images.values()))
+    
+    def _get_base64(self, img_bytes, max_height):
+        """Возвращает (PNG из _get_resized_image, его base64 в bytes).
+        
+        base64 кэшируется по тому же ключу (хэш, макс. высота), что и PNG.
+        """
+        key = (ImageCache.get_image_hash(img_bytes), max_height)
+        encoded = self._get_resized_image(img_bytes, max_height, key)
+        img_base64 = self._b64_cache.get(key)
+        if img_base64 is None:
+            img_base64 = b64encode(encoded)
+            self._b64_cache[key] = img_base64
+        return encoded, img_base64
+    
+    def _get_pdf_image(self, img_bytes, max_height):
+        """Возвращает (ImageReader, ширина, высота), один объект на картинку.
+        
+        Повторяющиеся изображения не перекодируются, а ReportLab по тому же
+        содержимому сам записывает в PDF только один XObject.
+        """
+        from reportlab.lib.utils import ImageReader
+        
+        key = ImageCache.get_image_hash(img_bytes)
+        cached = self._pdf_image_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # PNG/JPEG, которые не нужно уменьшать, отдаем ReportLab как есть:
+        # JPEG он встраивает без декодирования, PNG – без лишнего перекодирования
+        img_size = peek_image_size(img_bytes)
+        if img_size is not None and img_size[1] <= max_height:
+            reader = ImageReader(io.BytesIO(img_bytes))
+            img_width, img_height = img_size
+        else:
+            # Уменьшенное изображение ReportLab получает как PIL Image: PNG-буфер
+            # здесь не нужен, он все равно декодировался бы обратно в пиксели
+            img = self._resize_image(img_bytes, max_height)
+            reader = ImageReader(img)
+            img_width, img_height = img.size
+        cached = (reader, img_width, img_height)
+        
+        self._pdf_image_cache[key] = cached
+        return cached
+    
     def export_to_docx(self):
         """Экспорт в DOCX с сохранением форматирования."""
         doc = Document()
@@ -393,40 +949,65 @@ class ExportWorker(QThread):
         # Переводим сантиметры в дюймы (1 дюйм = 2.54 см)
         MAX_HEIGHT_INCHES = MAX_HEIGHT_CM / 2.54
         
+        # doc.add_paragraph() каждый раз ищет w:sectPr среди всех абзацев тела,
+        # и экспорт растет квадратично. Ищем его один раз и вставляем новые
+        # абзацы прямо перед ним. Родителю абзаца нужен только .part (для стилей
+        # и картинок), его дает сам Document
+        body = doc.element.body
+        sect_pr = body.sectPr
+        
+        def add_paragraph(text=''):
+            p = OxmlElement('w:p')
+            if sect_pr is not None:
+                sect_pr.addprevious(p)
+            else:
+                body.append(p)
+            paragraph = Paragraph(p, doc)
+            if text:
+                paragraph.add_run(text)
+            return paragraph
+        
         for idx, question in enumerate(self.questions):
-            # Получаем текст вопроса
-            question_text = question['text']
+            # Текст вопроса (с новым номером при нумерации по порядку) и его части по [BILD]
+            question_text, text_parts = self._question_text(question, idx)
             images = question['images']
             
-            # Если выбрана нумерация по порядку, заменяем номер в тексте
-            if self.export_options.get('numbering') == 'sequential':
-                # Ищем и заменяем "Aufgabe XX" на "Aufgabe [номер]"
-                pattern = r'(Aufgabe\s+)(\d+)'
-                new_number = str(idx + 1)
-                question_text = re.sub(pattern, rf'\g<1>{new_number}', question_text, flags=re.IGNORECASE)
-            
-            # Разделяем текст на части по маркерам [BILD]
-            text_parts = question_text.split('[BILD]')
-            
             for i, part in enumerate(text_parts):
                 if part.strip():
-                    # Сохраняем оригинальное форматирование с пробелами
-                    lines = part.split('\n')
-                    for line in lines:
-                        if line or (not line and i > 0):  # Сохраняем пустые строки
-                            p = doc.add_paragraph(line.rstrip())
+                    # Соседние строки с одинаковым отступом собираем в один абзац
+                    # через разрывы строк: абзац в python-docx намного дороже run
+                    p = None
+                    p_indented = False
+                    last_run = None
+                    for line in part.split('\n'):
+                        if not line:
+                            # Пустая строка завершает абзац
+                            p = None
+                            if i > 0:  # Сохраняем пустые строки
+                                add_paragraph()
+                            continue
+                        
+                        indented = line.startswith('    ') or line.startswith('\t')
+                        if p is None or indented != p_indented:
+                            p = add_paragraph()
+                            p_indented = indented
                             # Сохраняем оригинальные отступы
-                            if line.startswith('    ') or line.startswith('\t'):
+                            if indented:
                                 p.paragraph_format.left_indent = Pt(20)
+                        else:
+                            last_run.add_break(WD_BREAK.LINE)
+                        last_run = p.add_run(line.rstrip())
                 
                 # Добавляем изображение
                 if i < len(images):
                     try:
                         img_bytes = images[i]
                         
-                        # Загружаем изображение для проверки размеров
-                        img = Image.open(io.BytesIO(img_bytes))
-                        img_width, img_height = img.size
+                        # Размеры читаем из заголовка, PIL нужен только для экзотики
+                        img_size = peek_image_size(img_bytes)
+                        if img_size is None:
+                            img_size = Image.open(io.BytesIO(img_bytes)).size
+                        img_width, img_height = img_size
                         
                         # Переводим пиксели в дюймы (при 96 DPI)
                         # 1 дюйм = 96 пикселей при 96 DPI
@@ -434,33 +1015,17 @@ class ExportWorker(QThread):
                         
                         # Если высота изображения больше 25% страницы, уменьшаем
                         if height_inches > MAX_HEIGHT_INCHES:
-                            # Вычисляем коэффициент масштабирования
-                            scale_factor = MAX_HEIGHT_INCHES / height_inches
-                            
-                            # Вычисляем новые размеры в пикселях
-                            new_width = int(img_width * scale_factor)
-                            new_height = int(img_height * scale_factor)
-                            
-                            # Изменяем размер изображения
-                            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                            
-                            # Сохраняем измененное изображение в буфер
-                            img_buffer = io.BytesIO()
-                            img.save(img_buffer, format='PNG')
-                            img_buffer.seek(0)
-                            
-                            # Добавляем изображение с ограниченным размером
-                            doc.add_picture(img_buffer, width=Inches(MAX_HEIGHT_INCHES * (img_width/img_height)))
+                            # Пересэмплировать не нужно: Word сам отрисует картинку
+                            # в заданной ширине, достаточно указать размер
+                            add_paragraph().add_run().add_picture(
+                                io.BytesIO(img_bytes),
+                                width=Inches(MAX_HEIGHT_INCHES * (img_width/img_height)))
                             
                             logger.info(f"Изображение уменьшено: {height_inches:.2f} → {MAX_HEIGHT_INCHES:.2f} дюймов")
                         else:
-                            # Добавляем изображение оригинального размера
-                            img_buffer = io.BytesIO(img_bytes)
-                            img_buffer.seek(0)
-                            doc.add_picture(img_buffer)
-                            
-                        # Закрываем буфер
-                        img_buffer.close()
+                            # Добавляем изображение оригинального размера без перекодирования;
+                            # BytesIO над bytes не копирует данные
+                            add_paragraph().add_run().add_picture(io.BytesIO(img_bytes))
                         
                     except Exception as e:
                         logger.error(f"Ошибка сохранения изображения: {e}")
@@ -468,26 +1033,19 @@ class ExportWorker(QThread):
             # Добавляем разделитель между вопросами
             if idx < len(self.questions) - 1:
                 separator = '~' * 80
-                p = doc.add_paragraph(separator)
+                p = add_paragraph(separator)
                 p.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
             
-            self.progress.emit(int((idx + 1) / len(self.questions) * 100))
+            self._emit_progress(idx + 1)
         
-        doc.save(self.export_path)
+        save_docx(doc, self.export_path)
     
     def export_to_txt(self):
         """Экспорт в TXT с сохранением форматирования."""
         with open(self.export_path, 'w', encoding='utf-8') as f:
             for idx, question in enumerate(self.questions):
-                # Получаем текст вопроса
-                question_text = question['text']
-                
-                # Если выбрана нумерация по порядку, заменяем номер в тексте
-                if self.export_options.get('numbering') == 'sequential':
-                    # Ищем и заменяем "Aufgabe XX" на "Aufgabe [номер]"
-                    pattern = r'(Aufgabe\s+)(\d+)'
-                    new_number = str(idx + 1)
-                    question_text = re.sub(pattern, rf'\g<1>{new_number}', question_text, flags=re.IGNORECASE)
+                # Текст вопроса (с новым номером при нумерации по порядку)
+                question_text, _ = self._question_text(question, idx)
                 
                 # Сохраняем текст с оригинальным форматированием
                 text = question_text.replace('[BILD]', '[Изображение]')
@@ -498,11 +1056,13 @@ class ExportWorker(QThread):
                 
                 f.write('\n' + '='*50 + '\n\n')
                 
-                self.progress.emit(int((idx + 1) / len(self.questions) * 100))
+                self._emit_progress(idx + 1)
     
     def export_to_html(self):
         """Экспорт в HTML."""
-        html_content = """
+        # Собираем документ из байтовых частей и склеиваем один раз в конце:
+        # base64 изображений так не приходится декодировать в str
+        parts = ["""
         <!DOCTYPE html>
         <html>
         <head>
@@ -519,94 +1079,69 @@ class ExportWorker(QThread):
         </head>
         <body>
             <h1>Список вопросов</h1>
-        """
+        """.encode('utf-8')]
         
         # Высота страницы A4 в пикселях (при 96 DPI) и 25% от нее
         PAGE_HEIGHT_PIXELS = int(11.69 * 96)  # ~1123 пикселей
         MAX_HEIGHT_PIXELS = int(PAGE_HEIGHT_PIXELS * 0.25)  # ~281 пикселей
         
+        self._prefetch_images(MAX_HEIGHT_PIXELS, with_base64=True)
+        
         for idx, question in enumerate(self.questions):
-            html_content += f"""
+            parts.append(b"""
             <div class="question">
-            """
-            
-            # Получаем текст вопроса
-            question_text = question['text']
+            """)
             
-            # Если выбрана нумерация по порядку, заменяем номер в тексте
-            if self.export_options.get('numbering') == 'sequential':
-                # Ищем и заменяем "Aufgabe XX" на "Aufgabe [номер]"
-                pattern = r'(Aufgabe\s+)(\d+)'
-                new_number = str(idx + 1)
-                question_text = re.sub(pattern, rf'\g<1>{new_number}', question_text, flags=re.IGNORECASE)
+            # Текст вопроса (с новым номером при нумерации по порядку) и его части по [BILD]
+            question_text, text_parts = self._question_text(question, idx)
             
-            html_content += '<div class="question-text">'
+            parts.append(b'<div class="question-text">')
             
-            text_parts = question_text.split('[BILD]')
             images = question['images']
             
             for i, part in enumerate(text_parts):
                 if part.strip():
                     # Сохраняем форматирование с заменой переносов строк
                     part_html = part.replace('\n', '<br>')
-                    html_content += part_html
+                    parts.append(part_html.encode('utf-8'))
                 
                 if i < len(images):
                     try:
-                        import base64
-                        img_bytes = images[i]
-                        
-                        # Загружаем изображение для проверки размеров
-                        img = Image.open(io.BytesIO(img_bytes))
-                        img_width, img_height = img.size
-                        
-                        # Если высота изображения больше 25% страницы, уменьшаем
-                        if img_height > MAX_HEIGHT_PIXELS:
-                            scale_factor = MAX_HEIGHT_PIXELS / img_height
-                            new_width = int(img_width * scale_factor)
-                            new_height = MAX_HEIGHT_PIXELS
-                            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                        
-                        # Сохраняем изображение в буфер
-                        img_buffer = io.BytesIO()
-                        img.save(img_buffer, format='PNG')
-                        img_buffer.seek(0)
-                        img_bytes = img_buffer.getvalue()
-                        img_buffer.close()
-                        
-                        img_base64 = base64.b64encode(img_bytes).decode('utf-8')
-                        html_content += f"""
+                        # Уменьшаем до 25% высоты страницы и кодируем в PNG
+                        img_bytes, img_base64 = self._get_base64(images[i], MAX_HEIGHT_PIXELS)
+                        parts.append(b"""
                         <div class="image-container">
-                            <img src="data:image/png;base64,{img_base64}" 
+                            <img src="data:image/png;base64,""")
+                        parts.append(img_base64)
+                        parts.append(f"""" 
                                  alt="Изображение {i+1}">
                         </div>
-                        """
+                        """.encode('utf-8'))
                     except Exception as e:
                         logger.error(f"Ошибка обработки изображения для HTML: {e}")
-                        html_content += f'<div>[Изображение {i+1}]</div>'
+                        parts.append(f'<div>[Изображение {i+1}]</div>'.encode('utf-8'))
             
-            html_content += """
+            parts.append(b"""
                 </div>
             </div>
-            """
+            """)
             
             if idx < len(self.questions) - 1:
-                html_content += '<div class="separator"></div>'
+                parts.append(b'<div class="separator"></div>')
             
-            self.progress.emit(int((idx + 1) / len(self.questions) * 100))
+            self._emit_progress(idx + 1)
         
-        html_content += """
+        parts.append(b"""
         </body>
         </html>
-        """
+        """)
         
-        with open(self.export_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        with open(self.export_path, 'wb') as f:
+            f.write(b''.join(parts))
     
     def export_to_json(self):
         """Экспорт в JSON."""
         import json
-        import base64
         
         data = {
             'total_questions': len(self.questions),
@@ -617,16 +1152,11 @@ class ExportWorker(QThread):
         PAGE_HEIGHT_PIXELS = int(11.69 * 96)  # ~1123 пикселей
         MAX_HEIGHT_PIXELS = int(PAGE_HEIGHT_PIXELS * 0.25)  # ~281 пикселей
         
+        self._prefetch_images(MAX_HEIGHT_PIXELS, with_base64=True)
+        
         for idx, question in enumerate(self.questions):
-            # Получаем текст вопроса
-            question_text = question['text']
-            
-            # Если выбрана нумерация по порядку, заменяем номер в тексте
-            if self.export_options.get('numbering') == 'sequential':
-                # Ищем и заменяем "Aufgabe XX" на "Aufgabe [номер]"
-                pattern = r'(Aufgabe\s+)(\d+)'
-                new_number = str(idx + 1)
-                question_text = re.sub(pattern, rf'\g<1>{new_number}', question_text, flags=re.IGNORECASE)
+            # Текст вопроса (с новым номером при нумерации по порядку)
+            question_text, _ = self._question_text(question, idx)
             
             question_data = {
                 'number': idx + 1 if self.export_options.get('numbering') == 'sequential' else None,
@@ -638,45 +1168,31 @@ class ExportWorker(QThread):
             # Конвертируем изображения в base64
             for img_idx, img_bytes in enumerate(question['images']):
                 try:
-                    # Загружаем изображение для проверки размеров
-                    img = Image.open(io.BytesIO(img_bytes))
-                    img_width, img_height = img.size
-                    
-                    # Если высота изображения больше 25% страницы, уменьшаем
-                    if img_height > MAX_HEIGHT_PIXELS:
-                        scale_factor = MAX_HEIGHT_PIXELS / img_height
-                        new_width = int(img_width * scale_factor)
-                        new_height = MAX_HEIGHT_PIXELS
-                        img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    
-                    # Сохраняем изображение в буфер
-                    img_buffer = io.BytesIO()
-                    img.save(img_buffer, format='PNG')
-                    img_buffer.seek(0)
-                    img_bytes = img_buffer.getvalue()
-                    img_buffer.close()
-                    
-                    img_base64 = base64.b64encode(img_bytes).decode('utf-8')
+                    # Уменьшаем до 25% высоты страницы и кодируем в PNG
+                    img_bytes, img_base64 = self._get_base64(img_bytes, MAX_HEIGHT_PIXELS)
                     question_data['images'].append({
                         'index': img_idx + 1,
-                        'data': img_base64,
+                        'data': img_base64.decode('ascii'),
                         'size': len(img_bytes)
                     })
                 except Exception as e:
                     logger.error(f"Ошибка кодирования изображения: {e}")
             
             data['questions'].append(question_data)
-            self.progress.emit(int((idx + 1) / len(self.questions) * 100))
+            self._emit_progress(idx + 1)
         
-        with open(self.export_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(self.export_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.export_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
     
     def export_to_pdf(self):
         """Экспорт в PDF."""
         try:
             from reportlab.lib.pagesizes import A4
             from reportlab.pdfgen import canvas
-            from reportlab.lib.utils import ImageReader
             from reportlab.pdfbase import pdfmetrics
             from reportlab.pdfbase.ttfonts import TTFont
             from reportlab.lib.units import cm
@@ -718,6 +1234,13 @@ class ExportWorker(QThread):
             available_width = width - left_margin - right_margin
             available_height = height - top_margin - bottom_margin
             
+            # Разделитель описываем один раз, на каждой странице – только ссылка
+            c.beginForm('separator', lowerx=0, lowery=-1, upperx=available_width, uppery=1)
+            c.setStrokeColorRGB(0.8, 0.8, 0.8)
+            c.setLineWidth(0.5)
+            c.line(0, 0, available_width, 0)
+            c.endForm()
+            
             y_position = height - top_margin
             page_num = 1
             
@@ -725,65 +1248,67 @@ class ExportWorker(QThread):
             PAGE_HEIGHT_PIXELS = int(11.69 * 72)  # ~842 пикселей
             MAX_HEIGHT_PIXELS = int(PAGE_HEIGHT_PIXELS * 0.25)  # ~210 пикселей
             
+            # Сначала параллельно готовим все изображения, затем последовательно
+            # собираем страницы из готовых объектов
+            self._prefetch_images(MAX_HEIGHT_PIXELS, for_pdf=True)
+            
+            # Шрифт задаем один раз на страницу: showPage сбрасывает его
+            # к шрифту по умолчанию, поэтому новая страница идет через new_page
+            c.setFont(font_name, 11, 15)
+            
+            def new_page():
+                c.showPage()
+                c.setFont(font_name, 11, 15)
+            
             for idx, question in enumerate(self.questions):
                 # Проверяем, нужна ли новая страница
                 if y_position < bottom_margin + 100:
-                    c.showPage()
+                    new_page()
                     y_position = height - top_margin
                     page_num += 1
                 
-                # Получаем текст вопроса
-                question_text = question['text']
-                
-                # Если выбрана нумерация по порядку, заменяем номер в тексте
-                if self.export_options.get('numbering') == 'sequential':
-                    # Ищем и заменяем "Aufgabe XX" на "Aufgabe [номер]"
-                    pattern = r'(Aufgabe\s+)(\d+)'
-                    new_number = str(idx + 1)
-                    question_text = re.sub(pattern, rf'\g<1>{new_number}', question_text, flags=re.IGNORECASE)
+                # Текст вопроса (с новым номером при нумерации по порядку) и его части по [BILD]
+                question_text, text_parts = self._question_text(question, idx)
                 
-                # Удаляем маркеры изображений из текста
-                text_parts = question_text.split('[BILD]')
                 images = question['images']
                 
                 # Обрабатываем текст и изображения
                 for i, text_part in enumerate(text_parts):
                     if text_part.strip():
-                        # Обрабатываем текст
+                        # Все строки части выводим одним текстовым объектом;
+                        # шрифт и интерлиньяж он берет из состояния страницы
+                        text_obj = c.beginText(left_margin, y_position - 15)
+                        
                         lines = text_part.split('\n')
                         for line in lines:
                             if line.strip():
                                 # Проверяем, нужна ли новая страница
                                 if y_position < bottom_margin + 20:
-                                    c.showPage()
+                                    c.drawText(text_obj)
+                                    new_page()
                                     y_position = height - top_margin
                                     page_num += 1
+                                    
+                                    text_obj = c.beginText(left_margin, y_position - 15)
                                 
-                                c.setFont(font_name, 11)
-                                c.drawString(left_margin, y_position - 15, line)
+                                text_obj.textLine(line)
                                 y_position -= 15
                             else:
-                                # Пустая строка
+                                # Пустая строка: сдвигаем следующую строку еще на 10
+                                text_obj.moveCursor(0, 10)
                                 y_position -= 10
+                        
+                        c.drawText(text_obj)
                     
                     # Добавляем изображение
                     if i < len(images):
                         if y_position < bottom_margin + 150:
-                            c.showPage()
+                            new_page()
                             y_position = height - top_margin
                             page_num += 1
                         
                         try:
-                            img = Image.open(io.BytesIO(images[i]))
-                            img_width, img_height = img.size
-                            
-                            # Если высота изображения больше 25% страницы, уменьшаем
-                            if img_height > MAX_HEIGHT_PIXELS:
-                                scale_factor = MAX_HEIGHT_PIXELS / img_height
-                                new_width = int(img_width * scale_factor)
-                                new_height = MAX_HEIGHT_PIXELS
-                                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                                img_width, img_height = new_width, new_height
+                            reader, img_width, img_height = self._get_pdf_image(images[i], MAX_HEIGHT_PIXELS)
                             
                             # Максимальные размеры для изображения
                             max_img_width = available_width
@@ -796,21 +1321,15 @@ class ExportWorker(QThread):
                             
                             # Проверяем, помещается ли изображение
                             if y_position - display_height < bottom_margin:
-                                c.showPage()
+                                new_page()
                                 y_position = height - top_margin
                                 page_num += 1
                             
-                            # Сохраняем изображение в буфер
-                            img_buffer = io.BytesIO()
-                            img.save(img_buffer, format='PNG')
-                            img_buffer.seek(0)
-                            
                             # Добавляем изображение в PDF
-                            c.drawImage(ImageReader(img_buffer), left_margin, y_position - display_height, 
+                            c.drawImage(reader, left_margin, y_position - display_height, 
                                       width=display_width, height=display_height)
                             
                             y_position -= display_height + 20
-                            img_buffer.close()
                             
                         except Exception as e:
                             logger.error(f"Ошибка добавления изображения в PDF: {e}")
@@ -820,19 +1339,19 @@ class ExportWorker(QThread):
                 # Добавляем разделитель между вопросами
                 if idx < len(self.questions) - 1:
                     if y_position < bottom_margin + 30:
-                        c.showPage()
+                        new_page()
                         y_position = height - top_margin
                         page_num += 1
                     
-                    # Линия разделителя
-                    c.setStrokeColorRGB(0.8, 0.8, 0.8)
-                    c.setLineWidth(0.5)
-                    c.line(left_margin, y_position - 20, left_margin + available_width, y_position - 20)
-                    c.setStrokeColorRGB(0, 0, 0)
+                    # Линия разделителя – ссылка на общий Form XObject
+                    c.saveState()
+                    c.translate(left_margin, y_position - 20)
+                    c.doForm('separator')
+                    c.restoreState()
                     
                     y_position -= 40
                 
-                self.progress.emit(int((idx + 1) / len(self.questions) * 100))
+                self._emit_progress(idx + 1)
             
             c.save()
             
@@ -904,12 +1423,22 @@ class ClickableQuestionWidget(QWidget):
 class QuestionWidget(QWidget):
     """Виджет для отображения одного вопроса с чекбоксом."""
     
-    def __init__(self, question_data, index, image_cache=None, parent=None):
+    def __init__(self, question_data, index, image_cache, parent=None, lazy=False):
         super().__init__(parent)
         self.question_data = question_data
         self.index = index
         self.image_cache = image_cache
+        self.content_built = False
+        # Меняется при освобождении: поздно декодированная картинка прежнего
+        # вопроса не должна попасть в переиспользованный виджет
+        self._content_generation = 0
         self.setup_ui()
+        if lazy:
+            # Пока вопрос не виден, вместо текста и картинок стоит пустое
+            # место примерно той же высоты, чтобы полоса прокрутки не прыгала
+            self.content_widget.setMinimumHeight(question_display_height(self.question_data))
+        else:
+            self.ensure_content()
     
     def setup_ui(self):
         # Основной контейнер с возможностью клика
@@ -936,11 +1465,32 @@ class QuestionWidget(QWidget):
         # Контент вопроса
         content_widget = QWidget()
         content_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        content_layout_question = QVBoxLayout(content_widget)
-        content_layout_question.setContentsMargins(5, 0, 0, 0)
+        self.content_widget = content_widget
+        self.content_layout_question = QVBoxLayout(content_widget)
+        self.content_layout_question.setContentsMargins(5, 0, 0, 0)
+        
+        # Делаем content_widget прозрачным для событий мыши
+        content_widget.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        
+        main_layout.addWidget(content_widget, 1)
+        content_layout.addLayout(main_layout)
+        
+        # Разделитель с правильным цветом
+        separator = QFrame()
+        separator.setFrameShape(QFrame.HLine)
+        separator.setFrameShadow(QFrame.Sunken)
+        layout.addWidget(separator)
+    
+    def ensure_content(self):
+        """Создает текст и изображения вопроса, если они еще не созданы."""
+        if self.content_built:
+            return
+        self.content_built = True
+        self.content_widget.setMinimumHeight(0)
+        content_layout_question = self.content_layout_question
         
         # Разделяем текст на части по маркерам [BILD]
-        text_parts = self.question_data['text'].split('[BILD]')
+        text_parts = question_parts(self.question_data)
         images = self.question_data['images']
         
         # Отображаем текст и изображения в правильном порядке
@@ -961,97 +1511,95 @@ class QuestionWidget(QWidget):
             if i < len(images):
                 img_bytes = images[i]
                 try:
-                    if self.image_cache:
-                        # Используем кэш изображений
-                        pixmap, _ = self.image_cache.scale_and_cache_image(img_bytes)
+                    img_label = QLabel()
+                    img_label.setAlignment(Qt.AlignCenter)
+                    img_label.setScaledContents(False)
+                    img_label.setMaximumSize(600, 400)
+                    img_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+                    
+                    image_container = QWidget()
+                    image_container_layout = QVBoxLayout(image_container)
+                    image_container_layout.setAlignment(Qt.AlignCenter)
+                    image_container_layout.addWidget(img_label)
+                    image_container.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+                    
+                    # Одинаковые картинки получают один и тот же QPixmap из общего кэша;
+                    # картинки не из кэша декодируются в фоне, а до тех пор метка
+                    # пустая, но уже нужного размера
+                    pixmap = self.image_cache.request_scaled_pixmap(
+                        img_bytes,
+                        lambda pixmap, label=img_label, container=image_container,
+                               generation=self._content_generation:
+                            self.set_image(generation, label, container, pixmap))
+                    if pixmap is not None:
+                        img_label.setPixmap(pixmap)
                     else:
-                        # Старый метод без кэша
-                        image = Image.open(io.BytesIO(img_bytes))
-                        max_width, max_height = 600, 400
-                        width, height = image.size
-                        if width > max_width or height > max_height:
-                            ratio = min(max_width/width, max_height/height)
-                            new_size = (int(width * ratio), int(height * ratio))
-                            image = image.resize(new_size, Image.Resampling.LANCZOS)
-                        
-                        if image.mode == "RGB":
-                            qimage = QImage(image.tobytes(), image.size[0], image.size[1], QImage.Format_RGB888)
-                        elif image.mode == "RGBA":
-                            qimage = QImage(image.tobytes(), image.size[0], image.size[1], QImage.Format_RGBA8888)
+                        size = peek_image_size(img_bytes)
+                        if size is None or not size[0] or not size[1]:
+                            img_label.setMinimumHeight(180)
                         else:
-                            image = image.convert("RGB")
-                            qimage = QImage(image.tobytes(), image.size[0], image.size[1], QImage.Format_RGB888)
-                        
-                        pixmap = QPixmap.fromImage(qimage)
+                            w, h = size
+                            scale = min(1, 600 / w, 400 / h)
+                            img_label.setMinimumSize(int(w * scale), int(h * scale))
                     
-                    if pixmap:
-                        img_label = QLabel()
-                        img_label.setPixmap(pixmap)
-                        img_label.setAlignment(Qt.AlignCenter)
-                        img_label.setScaledContents(False)
-                        img_label.setMaximumSize(600, 400)
-                        img_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-                        
-                        image_container = QWidget()
-                        image_container_layout = QVBoxLayout(image_container)
-                        image_container_layout.setAlignment(Qt.AlignCenter)
-                        image_container_layout.addWidget(img_label)
-                        image_container.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-                        
-                        content_layout_question.addWidget(image_container)
+                    content_layout_question.addWidget(image_container)
                     
                 except Exception as e:
                     logger.error(f"Ошибка загрузки изображения: {str(e)}")
                     error_label = QLabel(f"Не удалось загрузить изображение")
                     error_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
                     content_layout_question.addWidget(error_label)
-        
-        # Делаем content_widget прозрачным для событий мыши
-        content_widget.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-        
-        main_layout.addWidget(content_widget, 1)
-        content_layout.addLayout(main_layout)
-        
-        # Разделитель с правильным цветом
-        separator = QFrame()
-        separator.setFrameShape(QFrame.HLine)
-        separator.setFrameShadow(QFrame.Sunken)
-        layout.addWidget(separator)
     
-    def on_checkbox_changed(self, state):
-        """Обновляет стиль при изменении состояния чекбокса."""
-        theme = self.get_theme()
-        if state == Qt.Checked:
-            self.clickable_widget.setStyleSheet(f"""
-                ClickableQuestionWidget {{
-                    background-color: {theme['selected_bg']};
-                    border: 2px solid {theme['accent']};
-                    border-radius: 5px;
-                }}
-                ClickableQuestionWidget:hover {{
-                    background-color: {theme['hover_bg']};
-                }}
-            """)
-        else:
-            self.clickable_widget.setStyleSheet(f"""
-                ClickableQuestionWidget {{
-                    border: 1px solid transparent;
-                    border-radius: 5px;
-                }}
-                ClickableQuestionWidget:hover {{
-                    background-color: {theme['hover_bg']};
-                    border-color: {theme['accent']};
-                }}
-            """)
+    def set_image(self, generation, img_label, image_container, pixmap):
+        """Ставит декодированную в фоне картинку вместо пустой метки."""
+        if generation != self._content_generation:
+            return  # Виджет уже освобожден, метка удалена
+        if pixmap is None:
+            # Картинку декодировать не удалось – как и раньше, просто не показываем ее
+            image_container.hide()
+            return
+        img_label.setMinimumSize(0, 0)
+        img_label.setPixmap(pixmap)
     
-    def get_theme(self):
-        """Получает текущую тему из родительского окна."""
-        parent = self.parent()
-        while parent:
-            if hasattr(parent, 'theme_manager'):
-                return parent.theme_manager.get_theme()
-            parent = parent.parent()
-        return ThemeManager().get_theme('light')
+    def on_checkbox_changed(self, state):
+        """Обновляет стиль при изменении состояния чекбокса.
+        
+        Правила для обоих состояний лежат в общей таблице стилей темы, поэтому
+        здесь только переключается свойство, без разбора CSS на каждый виджет.
+        """
+        selected = state == Qt.Checked
+        widget = self.clickable_widget
+        if widget.property('selected') == selected:
+            return
+        widget.setProperty('selected', selected)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+    
+    def release(self):
+        """Убирает содержимое и данные вопроса, чтобы виджет можно было переиспользовать."""
+        layout = self.content_layout_question
+        while layout.count():
+            item = layout.takeAt(0)
+            if item.widget() is not None:
+                item.widget().deleteLater()
+        self.content_built = False
+        self._content_generation += 1
+        self.question_data = None
+        
+        # Снятие отметки не должно менять счетчик выбранных
+        with QSignalBlocker(self.checkbox):
+            self.checkbox.setChecked(False)
+        self.on_checkbox_changed(Qt.Unchecked)
+        self.hide()
+    
+    def reset(self, question_data, index):
+        """Привязывает освобожденный виджет к другому вопросу (содержимое – лениво)."""
+        self.question_data = question_data
+        self.index = index
+        self.clickable_widget.index = index
+        self.content_widget.setMinimumHeight(question_display_height(question_data))
+        self.show()
     
     def is_checked(self):
         return self.checkbox.isChecked()
@@ -1115,9 +1663,314 @@ class ExportDialog(QDialog):
         }
 
 
+# Тексты интерфейса по языкам; собираются один раз при импорте модуля
+UI_TEXTS = {
+    'ru': {
+        'window_title': 'Выбор вопросов из Word файла',
+        'load_file': '📂 Загрузить файл',
+        'drag_drop': '📄 Перетащите сюда .docx файл',
+        'selected': 'Выбрано:',
+        'loaded': 'Загружено:',
+        'questions': 'Вопросы',
+        'actions': 'Действия',
+        'random_select': '🎲 Случайно выбрать',
+        'save_selected': '💾 Сохранить выбранные',
+        'select_all': '✅ Выбрать все',
+        'deselect_all': '❌ Снять выделение',
+        'language': 'Язык',
+        'theme': 'Тема',
+        'export': '📤 Экспорт',
+        'search': '🔍 Поиск...',
+        'file_dialog_title': 'Выберите Word файл',
+        'success_load': 'Успех',
+        'error_load': 'Ошибка',
+        'success_save': 'Успех',
+        'error_save': 'Ошибка',
+        'no_questions': 'Нет выбранных вопросов',
+        'less_than_count': 'В файле {} вопросов, меньше чем {}',
+        'file_saved': 'Сохранено {} вопросов',
+        'export_dialog_title': 'Экспорт вопросов',
+        'export_progress': 'Экспорт...',
+        'export_complete': 'Экспорт завершен',
+        'export_error': 'Ошибка экспорта',
+        'loading_file': 'Загрузка файла...',
+        'parsing_questions': 'Парсинг вопросов...',
+        'creating_widgets': 'Создание интерфейса...',
+        'cancel': 'Отмена',
+        'settings': 'Настройки',
+        'statistics': 'Статистика',
+        'selection': 'Выбор',
+        'format': 'Формат',
+        'numbering': 'Нумерация',
+        'parameters': 'Параметры',
+        'include_images': 'Включать изображения',
+        'original_numbering': 'Как в оригинале',
+        'sequential_numbering': 'По порядку',
+        'random_count_label': 'Количество:',
+        'file_menu': 'Файл',
+        'edit_menu': 'Правка',
+        'settings_menu': 'Настройки',
+        'help_menu': 'Помощь',
+        'load_action': 'Загрузить файл',
+        'save_action': 'Сохранить выбранные',
+        'export_action': 'Экспорт...',
+        'exit_action': 'Выход',
+        'select_all_action': 'Выбрать все',
+        'deselect_all_action': 'Снять выделение',
+        'random_action': 'Случайные вопросы',
+        'theme_menu': 'Тема оформления',
+        'light_theme': 'Светлая',
+        'dark_theme': 'Темная',
+        'about_action': 'О программе',
+        'about_title': 'О программе',
+        'about_text': 'QuestionApp\n\nПриложение для работы с вопросами из Word файлов.\nВерсия 2.0\n\nВозможности:\n• Загрузка DOCX файлов с вопросами\n• Отображение текста и изображений\n• Выбор вопросов\n• Экспорт в различные форматы\n• Поддержка тем оформления\n\n Für meine Lieblingslehrerin Andrea Retter\n\n © Sienin Oleksandr 2026',
+        'original': 'Оригинал',
+        'sequential': 'По порядку',
+        'export_success': 'Экспорт успешно завершен',
+        'export_failed': 'Ошибка экспорта',
+        'no_file_selected': 'Файл не выбран',
+        'loading': 'Загрузка...',
+        'saving': 'Сохранение...',
+        'processing': 'Обработка...',
+        'complete': 'Завершено',
+        'select_file': 'Выберите файл',
+        'file_not_found': 'Файл не найден',
+        'invalid_format': 'Неверный формат файла',
+        'confirm_exit': 'Подтвердите выход',
+        'exit_message': 'Вы уверены, что хотите выйти?',
+        'yes': 'Да',
+        'no': 'Нет',
+        'ok': 'OK',
+        'close': 'Закрыть',
+        'save': 'Сохранить',
+        'open': 'Открыть',
+        'delete': 'Удалить',
+        'edit': 'Редактировать',
+        'view': 'Просмотр',
+        'help': 'Помощь',
+        'about': 'О программе',
+        'preferences': 'Настройки',
+        'exit': 'Выход',
+        'back': 'Назад',
+        'next': 'Далее',
+        'finish': 'Завершить',
+        'browse': 'Обзор',
+        'create': 'Создать',
+        'remove': 'Удалить',
+        'add': 'Добавить',
+        'clear': 'Очистить',
+        'reset': 'Сбросить',
+        'apply': 'Применить',
+        'accept': 'Принять',
+        'reject': 'Отклонить'
+    },
+    'uk': {
+        'window_title': 'Вибір питань з Word файлу',
+        'load_file': '📂 Завантажити файл',
+        'drag_drop': '📄 Перетягніть сюди .docх файл',
+        'selected': 'Вибрано:',
+        'loaded': 'Завантажено:',
+        'questions': 'Питання',
+        'actions': 'Дії',
+        'random_select': '🎲 Вибрати випадково',
+        'save_selected': '💾 Зберегти вибрані',
+        'select_all': '✅ Вибрати всі',
+        'deselect_all': '❌ Зняти виділення',
+        'language': 'Мова',
+        'theme': 'Тема',
+        'export': '📤 Експорт',
+        'search': '🔍 Пошук...',
+        'file_dialog_title': 'Виберіть Word файл',
+        'success_load': 'Успіх',
+        'error_load': 'Помилка',
+        'success_save': 'Успіх',
+        'error_save': 'Помилка',
+        'no_questions': 'Немає вибраних питань',
+        'less_than_count': 'У файлі {} питань, менше ніж {}',
+        'file_saved': 'Збережено {} питань',
+        'export_dialog_title': 'Експорт питань',
+        'export_progress': 'Експорт...',
+        'export_complete': 'Експорт завершено',
+        'export_error': 'Помилка експорту',
+        'loading_file': 'Завантаження файлу...',
+        'parsing_questions': 'Парсинг питань...',
+        'creating_widgets': 'Створення інтерфейсу...',
+        'cancel': 'Скасувати',
+        'settings': 'Налаштування',
+        'statistics': 'Статистика',
+        'selection': 'Вибір',
+        'format': 'Формат',
+        'numbering': 'Нумерація',
+        'parameters': 'Параметри',
+        'include_images': 'Включати зображення',
+        'original_numbering': 'Як в оригіналі',
+        'sequential_numbering': 'По порядку',
+        'random_count_label': 'Кількість:',
+        'file_menu': 'Файл',
+        'edit_menu': 'Правка',
+        'settings_menu': 'Налаштування',
+        'help_menu': 'Допомога',
+        'load_action': 'Завантажити файл',
+        'save_action': 'Зберегти вибрані',
+        'export_action': 'Експорт...',
+        'exit_action': 'Вихід',
+        'select_all_action': 'Вибрати всі',
+        'deselect_all_action': 'Зняти виділення',
+        'random_action': 'Випадкові питання',
+        'theme_menu': 'Тема оформлення',
+        'light_theme': 'Світла',
+        'dark_theme': 'Темна',
+        'about_action': 'Про програму',
+        'about_title': 'Про програму',
+        'about_text': 'QuestionApp\n\nПрограма для роботи з питаннями з Word файлів.\nВерсія 2.0\n\nМожливості:\n• Завантаження DOCX файлів з питаннями\n• Відображення тексту та зображень\n• Вибір питань\n• Експорт у різні формати\n• Підтримка тем оформлення\n\n Für meine Lieblingslehrerin Andrea Retter\n\n © Sienin Oleksandr 2026',
+        'original': 'Оригінал',
+        'sequential': 'По порядку',
+        'export_success': 'Експорт успішно завершено',
+        'export_failed': 'Помилка експорту',
+        'no_file_selected': 'Файл не вибрано',
+        'loading': 'Завантаження...',
+        'saving': 'Збереження...',
+        'processing': 'Обробка...',
+        'complete': 'Завершено',
+        'select_file': 'Виберіть файл',
+        'file_not_found': 'Файл не знайдено',
+        'invalid_format': 'Невірний формат файлу',
+        'confirm_exit': 'Підтвердіть вихід',
+        'exit_message': 'Ви впевнені, що хочете вийти?',
+        'yes': 'Так',
+        'no': 'Ні',
+        'ok': 'OK',
+        'close': 'Закрити',
+        'save': 'Зберегти',
+        'open': 'Відкрити',
+        'delete': 'Видалити',
+        'edit': 'Редагувати',
+        'view': 'Перегляд',
+        'help': 'Допомога',
+        'about': 'Про програму',
+        'preferences': 'Налаштування',
+        'exit': 'Вихід',
+        'back': 'Назад',
+        'next': 'Далі',
+        'finish': 'Завершити',
+        'browse': 'Огляд',
+        'create': 'Створити',
+        'remove': 'Видалити',
+        'add': 'Додати',
+        'clear': 'Очистити',
+        'reset': 'Скинути',
+        'apply': 'Застосувати',
+        'accept': 'Прийняти',
+        'reject': 'Відхилити'
+    },
+    'de': {
+        'window_title': 'Fragenauswahl aus Word-Datei',
+        'load_file': '📂 Datei laden',
+        'drag_drop': '📄 .docx-Datei hierher ziehen',
+        'selected': 'Ausgewählt:',
+        'loaded': 'Geladen:',
+        'questions': 'Fragen',
+        'actions': 'Aktionen',
+        'random_select': '🎲 Zufällig auswählen',
+        'save_selected': '💾 Ausgewählte speichern',
+        'select_all': '✅ Alle auswählen',
+        'deselect_all': '❌ Auswahl aufheben',
+        'language': 'Sprache',
+        'theme': 'Thema',
+        'export': '📤 Export',
+        'search': '🔍 Suchen...',
+        'file_dialog_title': 'Word-Datei auswählen',
+        'success_load': 'Erfolg',
+        'error_load': 'Fehler',
+        'success_save': 'Erfolg',
+        'error_save': 'Fehler',
+        'no_questions': 'Keine Fragen ausgewählt',
+        'less_than_count': 'Die Datei hat {} Fragen, weniger als {}',
+        'file_saved': '{} Fragen gespeichert',
+        'export_dialog_title': 'Fragen exportieren',
+        'export_progress': 'Exportieren...',
+        'export_complete': 'Export abgeschlossen',
+        'export_error': 'Exportfehler',
+        'loading_file': 'Datei wird geladen...',
+        'parsing_questions': 'Fragen werden geparst...',
+        'creating_widgets': 'Erstelle Benutzeroberfläche...',
+        'cancel': 'Abbrechen',
+        'settings': 'Einstellungen',
+        'statistics': 'Statistik',
+        'selection': 'Auswahl',
+        'format': 'Format',
+        'numbering': 'Nummerierung',
+        'parameters': 'Parameter',
+        'include_images': 'Bilder einbeziehen',
+        'original_numbering': 'Wie im Original',
+        'sequential_numbering': 'In Reihenfolge',
+        'random_count_label': 'Anzahl:',
+        'file_menu': 'Datei',
+        'edit_menu': 'Bearbeiten',
+        'settings_menu': 'Einstellungen',
+        'help_menu': 'Hilfe',
+        'load_action': 'Datei laden',
+        'save_action': 'Ausgewählte speichern',
+        'export_action': 'Export...',
+        'exit_action': 'Beenden',
+        'select_all_action': 'Alle auswählen',
+        'deselect_all_action': 'Auswahl aufheben',
+        'random_action': 'Zufällige Fragen',
+        'theme_menu': 'Design',
+        'light_theme': 'Hell',
+        'dark_theme': 'Dunkel',
+        'about_action': 'Über',
+        'about_title': 'Über',
+        'about_text': 'QuestionApp\n\nAnwendung zur Arbeit mit Fragen aus Word-Dateien.\nVersion 2.0\n\nFunktionen:\n• Laden von DOCX-Dateien mit Fragen\n• Anzeige von Text und Bildern\n• Auswahl von Fragen\n• Export in verschiedene Formate\n• Unterstützung von Designs\n\n Für meine Lieblingslehrerin Andrea Retter\n\n © Sienin Oleksandr 2026',
+        'original': 'Original',
+        'sequential': 'In Reihenfolge',
+        'export_success': 'Export erfolgreich abgeschlossen',
+        'export_failed': 'Exportfehler',
+        'no_file_selected': 'Keine Datei ausgewählt',
+        'loading': 'Laden...',
+        'saving': 'Speichern...',
+        'processing': 'Verarbeitung...',
+        'complete': 'Abgeschlossen',
+        'select_file': 'Datei auswählen',
+        'file_not_found': 'Datei nicht gefunden',
+        'invalid_format': 'Ungültiges Dateiformat',
+        'confirm_exit': 'Beenden bestätigen',
+        'exit_message': 'Sind Sie sicher, dass Sie beenden möchten?',
+        'yes': 'Ja',
+        'no': 'Nein',
+        'ok': 'OK',
+        'close': 'Schließen',
+        'save': 'Speichern',
+        'open': 'Öffnen',
+        'delete': 'Löschen',
+        'edit': 'Bearbeiten',
+        'view': 'Anzeigen',
+        'help': 'Hilfe',
+        'about': 'Über',
+        'preferences': 'Einstellungen',
+        'exit': 'Beenden',
+        'back': 'Zurück',
+        'next': 'Weiter',
+        'finish': 'Fertigstellen',
+        'browse': 'Durchsuchen',
+        'create': 'Erstellen',
+        'remove': 'Entfernen',
+        'add': 'Hinzufügen',
+        'clear': 'Löschen',
+        'reset': 'Zurücksetzen',
+        'apply': 'Anwenden',
+        'accept': 'Akzeptieren',
+        'reject': 'Ablehnen'
+    }
+}
+
+
 class QuestionApp(QMainWindow):
     """Главное окно приложения."""
     
+    # Сколько новых виджетов вопросов создается за один проход цикла событий
+    WIDGET_CHUNK_SIZE = 25
+    
     def __init__(self):
         super().__init__()
         
@@ -1129,7 +1982,19 @@ class QuestionApp(QMainWindow):
         # Переменные
         self.questions = []
         self.question_widgets = []
+        # Освобожденные виджеты вопросов для повторного использования
+        self._widget_pool = []
+        # Виджеты, содержимое которых еще не построено (по порядку в списке)
+        self._pending_widgets = []
+        # Отметки вопросов по индексам (1 – выбран), ведутся по сигналам чекбоксов:
+        # счетчик и выборка для экспорта не обращаются к виджетам
+        self._check_bits = bytearray()
+        self._search_corpus = ''
+        self._search_starts = []
+        self._question_visible = []
         self.current_file_path = None
+        self.load_worker = None
+        self.load_progress = None
         self.random_count = 30  # Количество случайных вопросов по умолчанию
         self.numbering_type = 'sequential'  # Тип нумерации: 'original' или 'sequential'
         
@@ -1138,6 +2003,7 @@ class QuestionApp(QMainWindow):
         
         # Тексты интерфейса
         self.ui_texts = self.load_ui_texts()
+        self.update_text_templates()
         
         self.setup_ui()
         self.apply_theme(self.current_theme)
@@ -1163,372 +2029,56 @@ class QuestionApp(QMainWindow):
         self.settings.setValue("geometry", self.saveGeometry())
     
     def load_ui_texts(self):
-        """Загружает тексты интерфейса."""
-        texts = {
-            'ru': {
-                'window_title': 'Выбор вопросов из Word файла',
-                'load_file': '📂 Загрузить файл',
-                'drag_drop': '📄 Перетащите сюда .docx файл',
-                'selected': 'Выбрано:',
-                'loaded': 'Загружено:',
-                'questions': 'Вопросы',
-                'actions': 'Действия',
-                'random_select': '🎲 Случайно выбрать',
-                'save_selected': '💾 Сохранить выбранные',
-                'select_all': '✅ Выбрать все',
-                'deselect_all': '❌ Снять выделение',
-                'language': 'Язык',
-                'theme': 'Тема',
-                'export': '📤 Экспорт',
-                'search': '🔍 Поиск...',
-                'file_dialog_title': 'Выберите Word файл',
-                'success_load': 'Успех',
-                'error_load': 'Ошибка',
-                'success_save': 'Успех',
-                'error_save': 'Ошибка',
-                'no_questions': 'Нет выбранных вопросов',
-                'less_than_count': 'В файле {} вопросов, меньше чем {}',
-                'file_saved': 'Сохранено {} вопросов',
-                'export_dialog_title': 'Экспорт вопросов',
-                'export_progress': 'Экспорт...',
-                'export_complete': 'Экспорт завершен',
-                'export_error': 'Ошибка экспорта',
-                'loading_file': 'Загрузка файла...',
-                'parsing_questions': 'Парсинг вопросов...',
-                'creating_widgets': 'Создание интерфейса...',
-                'cancel': 'Отмена',
-                'settings': 'Настройки',
-                'statistics': 'Статистика',
-                'selection': 'Выбор',
-                'format': 'Формат',
-                'numbering': 'Нумерация',
-                'parameters': 'Параметры',
-                'include_images': 'Включать изображения',
-                'original_numbering': 'Как в оригинале',
-                'sequential_numbering': 'По порядку',
-                'random_count_label': 'Количество:',
-                'file_menu': 'Файл',
-                'edit_menu': 'Правка',
-                'settings_menu': 'Настройки',
-                'help_menu': 'Помощь',
-                'load_action': 'Загрузить файл',
-                'save_action': 'Сохранить выбранные',
-                'export_action': 'Экспорт...',
-                'exit_action': 'Выход',
-                'select_all_action': 'Выбрать все',
-                'deselect_all_action': 'Снять выделение',
-                'random_action': 'Случайные вопросы',
-                'theme_menu': 'Тема оформления',
-                'light_theme': 'Светлая',
-                'dark_theme': 'Темная',
-                'about_action': 'О программе',
-                'about_title': 'О программе',
-                'about_text': 'QuestionApp\n\nПриложение для работы с вопросами из Word файлов.\nВерсия 2.0\n\nВозможности:\n• Загрузка DOCX файлов с вопросами\n• Отображение текста и изображений\n• Выбор вопросов\n• Экспорт в различные форматы\n• Поддержка тем оформления\n\n Für meine Lieblingslehrerin Andrea Retter\n\n © Sienin Oleksandr 2026',
-                'original': 'Оригинал',
-                'sequential': 'По порядку',
-                'export_success': 'Экспорт успешно завершен',
-                'export_failed': 'Ошибка экспорта',
-                'no_file_selected': 'Файл не выбран',
-                'loading': 'Загрузка...',
-                'saving': 'Сохранение...',
-                'processing': 'Обработка...',
-                'complete': 'Завершено',
-                'select_file': 'Выберите файл',
-                'file_not_found': 'Файл не найден',
-                'invalid_format': 'Неверный формат файла',
-                'confirm_exit': 'Подтвердите выход',
-                'exit_message': 'Вы уверены, что хотите выйти?',
-                'yes': 'Да',
-                'no': 'Нет',
-                'ok': 'OK',
-                'close': 'Закрыть',
-                'save': 'Сохранить',
-                'open': 'Открыть',
-                'delete': 'Удалить',
-                'edit': 'Редактировать',
-                'view': 'Просмотр',
-                'help': 'Помощь',
-                'about': 'О программе',
-                'preferences': 'Настройки',
-                'exit': 'Выход',
-                'back': 'Назад',
-                'next': 'Далее',
-                'finish': 'Завершить',
-                'browse': 'Обзор',
-                'create': 'Создать',
-                'remove': 'Удалить',
-                'add': 'Добавить',
-                'clear': 'Очистить',
-                'reset': 'Сбросить',
-                'apply': 'Применить',
-                'accept': 'Принять',
-                'reject': 'Отклонить'
-            },
-            'uk': {
-                'window_title': 'Вибір питань з Word файлу',
-                'load_file': '📂 Завантажити файл',
-                'drag_drop': '📄 Перетягніть сюди .docх файл',
-                'selected': 'Вибрано:',
-                'loaded': 'Завантажено:',
-                'questions': 'Питання',
-                'actions': 'Дії',
-                'random_select': '🎲 Вибрати випадково',
-                'save_selected': '💾 Зберегти вибрані',
-                'select_all': '✅ Вибрати всі',
-                'deselect_all': '❌ Зняти виділення',
-                'language': 'Мова',
-                'theme': 'Тема',
-                'export': '📤 Експорт',
-                'search': '🔍 Пошук...',
-                'file_dialog_title': 'Виберіть Word файл',
-                'success_load': 'Успіх',
-                'error_load': 'Помилка',
-                'success_save': 'Успіх',
-                'error_save': 'Помилка',
-                'no_questions': 'Немає вибраних питань',
-                'less_than_count': 'У файлі {} питань, менше ніж {}',
-                'file_saved': 'Збережено {} питань',
-                'export_dialog_title': 'Експорт питань',
-                'export_progress': 'Експорт...',
-                'export_complete': 'Експорт завершено',
-                'export_error': 'Помилка експорту',
-                'loading_file': 'Завантаження файлу...',
-                'parsing_questions': 'Парсинг питань...',
-                'creating_widgets': 'Створення інтерфейсу...',
-                'cancel': 'Скасувати',
-                'settings': 'Налаштування',
-                'statistics': 'Статистика',
-                'selection': 'Вибір',
-                'format': 'Формат',
-                'numbering': 'Нумерація',
-                'parameters': 'Параметри',
-                'include_images': 'Включати зображення',
-                'original_numbering': 'Як в оригіналі',
-                'sequential_numbering': 'По порядку',
-                'random_count_label': 'Кількість:',
-                'file_menu': 'Файл',
-                'edit_menu': 'Правка',
-                'settings_menu': 'Налаштування',
-                'help_menu': 'Допомога',
-                'load_action': 'Завантажити файл',
-                'save_action': 'Зберегти вибрані',
-                'export_action': 'Експорт...',
-                'exit_action': 'Вихід',
-                'select_all_action': 'Вибрати всі',
-                'deselect_all_action': 'Зняти виділення',
-                'random_action': 'Випадкові питання',
-                'theme_menu': 'Тема оформлення',
-                'light_theme': 'Світла',
-                'dark_theme': 'Темна',
-                'about_action': 'Про програму',
-                'about_title': 'Про програму',
-                'about_text': 'QuestionApp\n\nПрограма для роботи з питаннями з Word файлів.\nВерсія 2.0\n\nМожливості:\n• Завантаження DOCX файлів з питаннями\n• Відображення тексту та зображень\n• Вибір питань\n• Експорт у різні формати\n• Підтримка тем оформлення\n\n Für meine Lieblingslehrerin Andrea Retter\n\n © Sienin Oleksandr 2026',
-                'original': 'Оригінал',
-                'sequential': 'По порядку',
-                'export_success': 'Експорт успішно завершено',
-                'export_failed': 'Помилка експорту',
-                'no_file_selected': 'Файл не вибрано',
-                'loading': 'Завантаження...',
-                'saving': 'Збереження...',
-                'processing': 'Обробка...',
-                'complete': 'Завершено',
-                'select_file': 'Виберіть файл',
-                'file_not_found': 'Файл не знайдено',
-                'invalid_format': 'Невірний формат файлу',
-                'confirm_exit': 'Підтвердіть вихід',
-                'exit_message': 'Ви впевнені, що хочете вийти?',
-                'yes': 'Так',
-                'no': 'Ні',
-                'ok': 'OK',
-                'close': 'Закрити',
-                'save': 'Зберегти',
-                'open': 'Відкрити',
-                'delete': 'Видалити',
-                'edit': 'Редагувати',
-                'view': 'Перегляд',
-                'help': 'Допомога',
-                'about': 'Про програму',
-                'preferences': 'Налаштування',
-                'exit': 'Вихід',
-                'back': 'Назад',
-                'next': 'Далі',
-                'finish': 'Завершити',
-                'browse': 'Огляд',
-                'create': 'Створити',
-                'remove': 'Видалити',
-                'add': 'Додати',
-                'clear': 'Очистити',
-                'reset': 'Скинути',
-                'apply': 'Застосувати',
-                'accept': 'Прийняти',
-                'reject': 'Відхилити'
-            },
-            'de': {
-                'window_title': 'Fragenauswahl aus Word-Datei',
-                'load_file': '📂 Datei laden',
-                'drag_drop': '📄 .docx-Datei hierher ziehen',
-                'selected': 'Ausgewählt:',
-                'loaded': 'Geladen:',
-                'questions': 'Fragen',
-                'actions': 'Aktionen',
-                'random_select': '🎲 Zufällig auswählen',
-                'save_selected': '💾 Ausgewählte speichern',
-                'select_all': '✅ Alle auswählen',
-                'deselect_all': '❌ Auswahl aufheben',
-                'language': 'Sprache',
-                'theme': 'Thema',
-                'export': '📤 Export',
-                'search': '🔍 Suchen...',
-                'file_dialog_title': 'Word-Datei auswählen',
-                'success_load': 'Erfolg',
-                'error_load': 'Fehler',
-                'success_save': 'Erfolg',
-                'error_save': 'Fehler',
-                'no_questions': 'Keine Fragen ausgewählt',
-                'less_than_count': 'Die Datei hat {} Fragen, weniger als {}',
-                'file_saved': '{} Fragen gespeichert',
-                'export_dialog_title': 'Fragen exportieren',
-                'export_progress': 'Exportieren...',
-                'export_complete': 'Export abgeschlossen',
-                'export_error': 'Exportfehler',
-                'loading_file': 'Datei wird geladen...',
-                'parsing_questions': 'Fragen werden geparst...',
-                'creating_widgets': 'Erstelle Benutzeroberfläche...',
-                'cancel': 'Abbrechen',
-                'settings': 'Einstellungen',
-                'statistics': 'Statistik',
-                'selection': 'Auswahl',
-                'format': 'Format',
-                'numbering': 'Nummerierung',
-                'parameters': 'Parameter',
-                'include_images': 'Bilder einbeziehen',
-                'original_numbering': 'Wie im Original',
-                'sequential_numbering': 'In Reihenfolge',
-                'random_count_label': 'Anzahl:',
-                'file_menu': 'Datei',
-                'edit_menu': 'Bearbeiten',
-                'settings_menu': 'Einstellungen',
-                'help_menu': 'Hilfe',
-                'load_action': 'Datei laden',
-                'save_action': 'Ausgewählte speichern',
-                'export_action': 'Export...',
-                'exit_action': 'Beenden',
-                'select_all_action': 'Alle auswählen',
-                'deselect_all_action': 'Auswahl aufheben',
-                'random_action': 'Zufällige Fragen',
-                'theme_menu': 'Design',
-                'light_theme': 'Hell',
-                'dark_theme': 'Dunkel',
-                'about_action': 'Über',
-                'about_title': 'Über',
-                'about_text': 'QuestionApp\n\nAnwendung zur Arbeit mit Fragen aus Word-Dateien.\nVersion 2.0\n\nFunktionen:\n• Laden von DOCX-Dateien mit Fragen\n• Anzeige von Text und Bildern\n• Auswahl von Fragen\n• Export in verschiedene Formate\n• Unterstützung von Designs\n\n Für meine Lieblingslehrerin Andrea Retter\n\n © Sienin Oleksandr 2026',
-                'original': 'Original',
-                'sequential': 'In Reihenfolge',
-                'export_success': 'Export erfolgreich abgeschlossen',
-                'export_failed': 'Exportfehler',
-                'no_file_selected': 'Keine Datei ausgewählt',
-                'loading': 'Laden...',
-                'saving': 'Speichern...',
-                'processing': 'Verarbeitung...',
-                'complete': 'Abgeschlossen',
-                'select_file': 'Datei auswählen',
-                'file_not_found': 'Datei nicht gefunden',
-                'invalid_format': 'Ungültiges Dateiformat',
-                'confirm_exit': 'Beenden bestätigen',
-                'exit_message': 'Sind Sie sicher, dass Sie beenden möchten?',
-                'yes': 'Ja',
-                'no': 'Nein',
-                'ok': 'OK',
-                'close': 'Schließen',
-                'save': 'Speichern',
-                'open': 'Öffnen',
-                'delete': 'Löschen',
-                'edit': 'Bearbeiten',
-                'view': 'Anzeigen',
-                'help': 'Hilfe',
-                'about': 'Über',
-                'preferences': 'Einstellungen',
-                'exit': 'Beenden',
-                'back': 'Zurück',
-                'next': 'Weiter',
-                'finish': 'Fertigstellen',
-                'browse': 'Durchsuchen',
-                'create': 'Erstellen',
-                'remove': 'Entfernen',
-                'add': 'Hinzufügen',
-                'clear': 'Löschen',
-                'reset': 'Zurücksetzen',
-                'apply': 'Anwenden',
-                'accept': 'Akzeptieren',
-                'reject': 'Ablehnen'
-            }
-        }
+        """Загружает тексты интерфейса.
         
-        return texts.get(self.current_language, texts['ru'])
+        Таблица общая для всех окон, поэтому отдается только для чтения.
+        """
+        return MappingProxyType(UI_TEXTS.get(self.current_language, UI_TEXTS['ru']))
+    
+    def update_text_templates(self):
+        """Готовит шаблоны счетчиков один раз на язык, а не при каждом обновлении."""
+        self._counter_fmt = self.ui_texts['selected'] + ': {}'
+        self._loaded_fmt = self.ui_texts['loaded'] + ': {}'
     
     def retranslate_ui(self):
         """Полностью переводит интерфейс."""
+        # Все setText/setTitle ниже перерисовываются одним проходом в конце
+        self.setUpdatesEnabled(False)
+        try:
+            self._retranslate_texts()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _retranslate_texts(self):
+        """Обновляет тексты всех элементов интерфейса под текущий язык."""
         # Перезагружаем тексты
         self.ui_texts = self.load_ui_texts()
+        self.update_text_templates()
+        t = self.ui_texts
         
-        # Обновляем все элементы интерфейса
+        # Подписи элементов и меню (таблица перевода) и счетчики
         self.update_ui_texts()
         
-        # Обновляем меню
-        if hasattr(self, 'file_menu'):
-            self.file_menu.setTitle(self.ui_texts['file_menu'])
-            self.load_action.setText(self.ui_texts['load_action'])
-            self.save_action.setText(self.ui_texts['save_action'])
-            self.export_action.setText(self.ui_texts['export_action'])
-            self.exit_action.setText(self.ui_texts['exit_action'])
-        
-        if hasattr(self, 'edit_menu'):
-            self.edit_menu.setTitle(self.ui_texts['edit_menu'])
-            self.select_all_action.setText(self.ui_texts['select_all_action'])
-            self.deselect_all_action.setText(self.ui_texts['deselect_all_action'])
-            self.random_action.setText(self.ui_texts['random_action'])
-        
-        if hasattr(self, 'settings_menu'):
-            self.settings_menu.setTitle(self.ui_texts['settings_menu'])
-            self.theme_menu.setTitle(self.ui_texts['theme_menu'])
-            self.light_action.setText(self.ui_texts['light_theme'])
-            self.dark_action.setText(self.ui_texts['dark_theme'])
-        
-        if hasattr(self, 'help_menu'):
-            self.help_menu.setTitle(self.ui_texts['help_menu'])
-            self.about_action.setText(self.ui_texts['about_action'])
-        
         # Обновляем комбобокс языков
         if hasattr(self, 'lang_combo'):
-            self.lang_combo.blockSignals(True)
-            self.lang_combo.clear()
-            self.lang_combo.addItems(['🇷🇺 Русский', '🇺🇦 Українська', '🇩🇪 Deutsch'])
-            
-            # Устанавливаем текущий язык
-            lang_map = {'ru': 0, 'uk': 1, 'de': 2}
-            if self.current_language in lang_map:
-                self.lang_combo.setCurrentIndex(lang_map[self.current_language])
-            self.lang_combo.blockSignals(False)
+            # Названия языков не переводятся, поэтому список не пересоздаем
+            with QSignalBlocker(self.lang_combo):
+                # Устанавливаем текущий язык
+                lang_map = {'ru': 0, 'uk': 1, 'de': 2}
+                if self.current_language in lang_map:
+                    self.lang_combo.setCurrentIndex(lang_map[self.current_language])
         
         # Обновляем комбобокс тем
         if hasattr(self, 'theme_combo'):
-            self.theme_combo.blockSignals(True)
-            self.theme_combo.clear()
-            self.theme_combo.addItems([self.ui_texts['light_theme'], self.ui_texts['dark_theme']])
-            
-            # Устанавливаем текущую тему
-            theme_map = {'light': 0, 'dark': 1}
-            if self.current_theme in theme_map:
-                self.theme_combo.setCurrentIndex(theme_map[self.current_theme])
-            self.theme_combo.blockSignals(False)
-        
-        # Обновляем группу нумерации
-        if hasattr(self, 'numbering_group'):
-            self.numbering_group.setTitle(self.ui_texts['numbering'])
-        if hasattr(self, 'numbering_original'):
-            self.numbering_original.setText(self.ui_texts['original_numbering'])
-        if hasattr(self, 'numbering_sequential'):
-            self.numbering_sequential.setText(self.ui_texts['sequential_numbering'])
+            # Переименовываем пункты на месте вместо clear()/addItems()
+            with QSignalBlocker(self.theme_combo):
+                self.theme_combo.setItemText(0, t['light_theme'])
+                self.theme_combo.setItemText(1, t['dark_theme'])
+                
+                # Устанавливаем текущую тему
+                theme_map = {'light': 0, 'dark': 1}
+                if self.current_theme in theme_map:
+                    self.theme_combo.setCurrentIndex(theme_map[self.current_theme])
     
     def setup_ui(self):
         central_widget = QWidget()
@@ -1549,6 +2099,9 @@ class QuestionApp(QMainWindow):
         
         # Настройка горячих клавиш
         self.setup_shortcuts()
+        
+        # Таблица переводимых подписей (все элементы уже созданы)
+        self.build_retranslate_table()
     
     def create_left_panel(self):
         panel = QWidget()
@@ -1613,7 +2166,12 @@ class QuestionApp(QMainWindow):
         # Поиск
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText(self.ui_texts['search'])
-        self.search_edit.textChanged.connect(self.filter_questions)
+        # Фильтруем не на каждую букву, а после паузы в наборе
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(lambda: self.filter_questions(self.search_edit.text()))
+        self.search_edit.textChanged.connect(lambda *_: self.filter_timer.start())
         layout.addWidget(self.search_edit)
         
         # Счетчики
@@ -1723,76 +2281,77 @@ class QuestionApp(QMainWindow):
         self.scroll_layout.setAlignment(Qt.AlignTop)
         self.scroll_area.setWidget(self.scroll_content)
         
+        # Содержимое вопросов создается, только когда они оказываются рядом
+        # с видимой областью; таймер объединяет частые события прокрутки
+        self.materialize_timer = QTimer(self)
+        self.materialize_timer.setSingleShot(True)
+        self.materialize_timer.setInterval(0)
+        self.materialize_timer.timeout.connect(self.materialize_visible_questions)
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(lambda *_: self.materialize_timer.start())
+        scroll_bar.rangeChanged.connect(lambda *_: self.materialize_timer.start())
+        
+        # Недостающие виджеты вопросов создаются порциями между событиями,
+        # чтобы большой файл не замораживал окно
+        self.build_timer = QTimer(self)
+        self.build_timer.setInterval(0)
+        self.build_timer.timeout.connect(self.build_next_question_widgets)
+        
         layout.addWidget(self.scroll_area)
         
         return panel
     
     def create_menu(self):
-        """Создает главное меню."""
-        menubar = self.menuBar()
-        
-        # Меню Файл
-        self.file_menu = menubar.addMenu(self.ui_texts['file_menu'])
-        
-        self.load_action = QAction(self.ui_texts['load_action'], self)
-        self.load_action.triggered.connect(self.load_file_dialog)
-        self.load_action.setShortcut('Ctrl+O')
-        self.file_menu.addAction(self.load_action)
-        
-        self.save_action = QAction(self.ui_texts['save_action'], self)
-        self.save_action.triggered.connect(self.save_selected)
-        self.save_action.setShortcut('Ctrl+S')
-        self.file_menu.addAction(self.save_action)
-        
-        self.export_action = QAction(self.ui_texts['export_action'], self)
-        self.export_action.triggered.connect(self.show_export_dialog)
-        self.export_action.setShortcut('Ctrl+E')
-        self.file_menu.addAction(self.export_action)
-        
-        self.file_menu.addSeparator()
+        """Создает главное меню.
         
-        self.exit_action = QAction(self.ui_texts['exit_action'], self)
-        self.exit_action.triggered.connect(self.close)
-        self.exit_action.setShortcut('Ctrl+Q')
-        self.file_menu.addAction(self.exit_action)
-        
-        # Меню Правка
-        self.edit_menu = menubar.addMenu(self.ui_texts['edit_menu'])
-        
-        self.select_all_action = QAction(self.ui_texts['select_all_action'], self)
-        self.select_all_action.triggered.connect(self.select_all_questions)
-        self.select_all_action.setShortcut('Ctrl+A')
-        self.edit_menu.addAction(self.select_all_action)
-        
-        self.deselect_all_action = QAction(self.ui_texts['deselect_all_action'], self)
-        self.deselect_all_action.triggered.connect(self.deselect_all_questions)
-        self.deselect_all_action.setShortcut('Ctrl+D')
-        self.edit_menu.addAction(self.deselect_all_action)
-        
-        self.random_action = QAction(self.ui_texts['random_action'], self)
-        self.random_action.triggered.connect(self.random_select)
-        self.random_action.setShortcut('Ctrl+R')
-        self.edit_menu.addAction(self.random_action)
-        
-        # Меню Настройки
-        self.settings_menu = menubar.addMenu(self.ui_texts['settings_menu'])
-        
-        self.theme_menu = self.settings_menu.addMenu(self.ui_texts['theme_menu'])
-        
-        self.light_action = QAction(self.ui_texts['light_theme'], self)
-        self.light_action.triggered.connect(lambda: self.change_theme_by_name('light'))
-        self.theme_menu.addAction(self.light_action)
-        
-        self.dark_action = QAction(self.ui_texts['dark_theme'], self)
-        self.dark_action.triggered.connect(lambda: self.change_theme_by_name('dark'))
-        self.theme_menu.addAction(self.dark_action)
-        
-        # Меню Помощь
-        self.help_menu = menubar.addMenu(self.ui_texts['help_menu'])
+        Меню описаны таблицей: (атрибут меню, родительское меню, действия).
+        Действие – (атрибут, ключ текста, сочетание клавиш, слот), None – разделитель.
+        Атрибуты меню совпадают с ключами их заголовков.
+        """
+        menubar = self.menuBar()
+        menus = (
+            ('file_menu', None, (
+                ('load_action', 'load_action', 'Ctrl+O', self.load_file_dialog),
+                ('save_action', 'save_action', 'Ctrl+S', self.save_selected),
+                ('export_action', 'export_action', 'Ctrl+E', self.show_export_dialog),
+                None,
+                ('exit_action', 'exit_action', 'Ctrl+Q', self.close),
+            )),
+            ('edit_menu', None, (
+                ('select_all_action', 'select_all_action', 'Ctrl+A', self.select_all_questions),
+                ('deselect_all_action', 'deselect_all_action', 'Ctrl+D', self.deselect_all_questions),
+                ('random_action', 'random_action', 'Ctrl+R', self.random_select),
+            )),
+            ('settings_menu', None, ()),
+            ('theme_menu', 'settings_menu', (
+                ('light_action', 'light_theme', None, lambda: self.change_theme_by_name('light')),
+                ('dark_action', 'dark_theme', None, lambda: self.change_theme_by_name('dark')),
+            )),
+            ('help_menu', None, (
+                ('about_action', 'about_action', None, self.show_about),
+            )),
+        )
         
-        self.about_action = QAction(self.ui_texts['about_action'], self)
-        self.about_action.triggered.connect(self.show_about)
-        self.help_menu.addAction(self.about_action)
+        # Те же пары (метод, ключ) потом попадают в таблицу перевода
+        self._menu_retranslate = []
+        for menu_attr, parent_attr, actions in menus:
+            parent = getattr(self, parent_attr) if parent_attr else menubar
+            menu = parent.addMenu(self.ui_texts[menu_attr])
+            setattr(self, menu_attr, menu)
+            self._menu_retranslate.append((menu.setTitle, menu_attr))
+            
+            for entry in actions:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                attr, text_key, shortcut, slot = entry
+                action = QAction(self.ui_texts[text_key], self)
+                action.triggered.connect(slot)
+                if shortcut:
+                    action.setShortcut(shortcut)
+                menu.addAction(action)
+                setattr(self, attr, action)
+                self._menu_retranslate.append((action.setText, text_key))
     
     def setup_shortcuts(self):
         """Настраивает горячие клавиши."""
@@ -1826,7 +2385,8 @@ class QuestionApp(QMainWindow):
     def change_language(self, index):
         """Изменяет язык интерфейса."""
         languages = ['ru', 'uk', 'de']
-        if 0 <= index < len(languages):
+        # Повторный выбор того же языка ничего не меняет – не перерисовываем интерфейс
+        if 0 <= index < len(languages) and languages[index] != self.current_language:
             self.current_language = languages[index]
             self.retranslate_ui()
             self.save_settings()
@@ -1844,41 +2404,54 @@ class QuestionApp(QMainWindow):
         self.random_count = value
         self.save_settings()
     
+    def build_retranslate_table(self):
+        """Собирает пары (метод установки текста, ключ) для всех переводимых подписей.
+        
+        Методы связываются один раз, и смена языка сводится к одному циклу.
+        """
+        self._retranslate_table = [
+            (self.setWindowTitle, 'window_title'),
+            
+            # Левая панель
+            (self.btn_load.setText, 'load_file'),
+            (self.drop_label.setText, 'drag_drop'),
+            (self.search_edit.setPlaceholderText, 'search'),
+            
+            # Группы и кнопки
+            (self.btn_select_all.setText, 'select_all'),
+            (self.btn_deselect_all.setText, 'deselect_all'),
+            (self.btn_random.setText, 'random_select'),
+            (self.btn_save.setText, 'save_selected'),
+            (self.btn_export.setText, 'export'),
+            
+            # Заголовки групп
+            (self.title_label.setText, 'questions'),
+            (self.settings_group.setTitle, 'settings'),
+            (self.stats_group.setTitle, 'statistics'),
+            (self.selection_group.setTitle, 'selection'),
+            (self.actions_group.setTitle, 'actions'),
+            (self.numbering_group.setTitle, 'numbering'),
+            
+            # Нумерация
+            (self.numbering_original.setText, 'original_numbering'),
+            (self.numbering_sequential.setText, 'sequential_numbering'),
+            
+            # Меню
+            *self._menu_retranslate,
+        ]
+    
     def update_ui_texts(self):
         """Обновляет все тексты интерфейса."""
-        if not self.ui_texts:
+        t = self.ui_texts
+        if not t:
             return
-            
-        self.setWindowTitle(self.ui_texts['window_title'])
         
-        # Обновляем левую панель
-        self.btn_load.setText(self.ui_texts['load_file'])
-        self.drop_label.setText(self.ui_texts['drag_drop'])
-        self.search_edit.setPlaceholderText(self.ui_texts['search'])
+        for setter, key in self._retranslate_table:
+            setter(t[key])
         
         # Обновляем счетчики
-        count = sum(1 for widget in self.question_widgets if widget.is_checked())
-        self.counter_label.setText(f"{self.ui_texts['selected']}: {count}")
-        self.loaded_label.setText(f"{self.ui_texts['loaded']}: {len(self.questions)}")
-        
-        # Обновляем группы и кнопки
-        self.btn_select_all.setText(self.ui_texts['select_all'])
-        self.btn_deselect_all.setText(self.ui_texts['deselect_all'])
-        self.btn_random.setText(self.ui_texts['random_select'])
-        self.btn_save.setText(self.ui_texts['save_selected'])
-        self.btn_export.setText(self.ui_texts['export'])
-        
-        # Обновляем заголовки групп
-        self.title_label.setText(self.ui_texts['questions'])
-        self.settings_group.setTitle(self.ui_texts['settings'])
-        self.stats_group.setTitle(self.ui_texts['statistics'])
-        self.selection_group.setTitle(self.ui_texts['selection'])
-        self.actions_group.setTitle(self.ui_texts['actions'])
-        self.numbering_group.setTitle(self.ui_texts['numbering'])
-        
-        # Обновляем нумерацию
-        self.numbering_original.setText(self.ui_texts['original_numbering'])
-        self.numbering_sequential.setText(self.ui_texts['sequential_numbering'])
+        self.counter_label.setText(self._counter_fmt.format(self._check_bits.count(1)))
+        self.loaded_label.setText(self._loaded_fmt.format(len(self.questions)))
     
     def load_file_dialog(self):
         """Открывает диалог выбора файла."""
@@ -1893,7 +2466,7 @@ class QuestionApp(QMainWindow):
             self.load_file(file_path)
     
     def load_file(self, file_path):
-        """Загружает и парсит файл."""
+        """Загружает и парсит файл в фоновом потоке."""
         try:
             # Показываем прогресс-диалог
             progress = QProgressDialog(
@@ -1905,21 +2478,64 @@ class QuestionApp(QMainWindow):
             progress.setMinimumDuration(0)
             progress.show()
             
-            # Загружаем документ
-            progress.setLabelText(self.ui_texts['loading_file'])
-            doc = Document(file_path)
-            progress.setValue(20)
-            
-            # Парсим вопросы
+            # Предыдущая незавершенная загрузка больше не нужна; окно становится
+            # ее владельцем, чтобы поток не был удален, пока еще работает, а по
+            # завершении потока он удаляется. Свой finished(list) у LoadWorker
+            # прерванная загрузка не шлет, поэтому берем QThread.finished
+            old_worker = self.load_worker
+            if old_worker is not None and old_worker.isRunning():
+                old_worker.requestInterruption()
+                old_worker.setParent(self)
+                QThread.finished.__get__(old_worker).connect(old_worker.deleteLater)
+                if old_worker.isFinished():
+                    old_worker.deleteLater()
+                # Диалог удаляем вместе с его связями: иначе запоздалый progress
+                # старого потока снова показал бы его через setValue
+                self.load_progress.close()
+                self.load_progress.deleteLater()
+            self.load_progress = progress
+            
+            # Чтение DOCX и разбор вопросов идут в отдельном потоке, интерфейс не замирает
             progress.setLabelText(self.ui_texts['parsing_questions'])
-            self.questions = self.parse_questions_with_images(doc)
-            progress.setValue(60)
+            worker = LoadWorker(file_path, self.parse_questions_with_images)
+            self.load_worker = worker
+            worker.progress.connect(progress.setValue)
+            worker.finished.connect(
+                lambda questions: self.on_load_finished(worker, file_path, questions, progress)
+            )
+            worker.error.connect(lambda message: self.on_load_error(worker, message, progress))
+            progress.canceled.connect(worker.requestInterruption)
+            
+            worker.start()
+            
+        except Exception as e:
+            logger.error(f"Ошибка загрузки файла: {str(e)}")
+            QMessageBox.critical(
+                self, 
+                self.ui_texts['error_load'], 
+                f"Не удалось загрузить файл:\n{str(e)}"
+            )
+    
+    def on_load_finished(self, worker, file_path, questions, progress):
+        """Показывает вопросы, разобранные фоновым потоком."""
+        # Результат устаревшей или отмененной загрузки отбрасываем. Отмена,
+        # нажатая уже после конца разбора, до потока не дошла: ее видно по диалогу
+        if (worker is not self.load_worker or worker.isInterruptionRequested()
+                or progress.wasCanceled()):
+            return
+        
+        try:
+            self.questions = questions
             
             # Очищаем предыдущие вопросы
             self.clear_questions()
             
-            # Создаем виджеты вопросов
+            # Создаем виджеты вопросов; изображения заранее готовим в пуле потоков
             progress.setLabelText(self.ui_texts['creating_widgets'])
+            self.image_cache.prefetch(
+                (img for q in self.questions for img in q['images']),
+                progress_callback=lambda done, total: progress.setValue(60 + 30 * done // total)
+            )
             self.create_question_widgets()
             progress.setValue(100)
             
@@ -1940,59 +2556,94 @@ class QuestionApp(QMainWindow):
                 f"Не удалось загрузить файл:\n{str(e)}"
             )
     
-    def parse_questions_with_images(self, doc):
-        """Парсит вопросы с изображениями из документа с сохранением форматирования."""
+    def on_load_error(self, worker, error_message, progress):
+        """Обработчик ошибки загрузки."""
+        # Ошибка устаревшей загрузки: ее диалог уже закрыт, сообщать не о чем
+        if worker is not self.load_worker:
+            return
+        progress.close()
+        QMessageBox.critical(
+            self, 
+            self.ui_texts['error_load'], 
+            f"Не удалось загрузить файл:\n{error_message}"
+        )
+    
+    def parse_questions_with_images(self, file_path):
+        """Парсит вопросы с изображениями из DOCX с сохранением форматирования.
+        
+        XML документа читается потоково, из архива берутся только картинки,
+        на которые ссылаются абзацы.
+        """
         questions = []
         current_question = {'text': '', 'images': []}
         text_buffer = []
         in_question = False
+        # Хэш содержимого -> bytes: одинаковые картинки становятся одним объектом
+        unique_images = {}
         
         try:
-            for i, paragraph in enumerate(doc.paragraphs):
-                text = paragraph.text
+            current_thread = QThread.currentThread()
+            with zipfile.ZipFile(file_path) as zf:
+                part_name = main_document_part(zf)
+                rels = read_part_rels(zf, part_name)
+                # Путь картинки в архиве -> готовые bytes: каждый файл читается один раз
+                media = {}
                 
-                # Проверяем начало вопроса
-                if "---START---" in text:
-                    if in_question:  # Предыдущий вопрос не закрыт
-                        logger.warning(f"Вопрос не закрыт ---END---")
-                        self.save_current_question(current_question, text_buffer, questions)
+                for i, paragraph in enumerate(iter_body_paragraphs(zf, part_name)):
+                    # Загрузку отменили – дальше разбирать незачем
+                    if current_thread.isInterruptionRequested():
+                        break
                     
-                    in_question = True
-                    current_question = {'text': '', 'images': []}
-                    text_buffer = []
-                    continue
-                
-                # Проверяем конец вопроса
-                if "---END---" in text:
-                    if not in_question:
-                        logger.warning(f"Лишний ---END--- в параграфе {i+1}")
-                    else:
-                        self.save_current_question(current_question, text_buffer, questions)
-                    in_question = False
-                    continue
-                
-                if in_question:
-                    # Извлекаем изображения из параграфа
-                    images = self.extract_images_from_paragraph(paragraph, doc)
+                    text = paragraph_text(paragraph)
+                    marker = _MARKER_RE.search(text)
+                    if marker:
+                        marker = marker.group(1)
+                        # Если в параграфе оба маркера, как и раньше, главнее START
+                        if marker == 'END' and '---START---' in text:
+                            marker = 'START'
                     
-                    # Если есть изображения, добавляем их в правильном порядке
-                    if images:
-                        # Для каждого изображения добавляем текст до него и само изображение
-                        # В этом упрощенном подходе мы добавляем весь текст параграфа, затем все изображения
-                        # Это может не сохранить точный порядок, если изображения внутри текста
-                        if text.strip():
-                            text_buffer.append(text)
+                    # Проверяем начало вопроса
+                    if marker == 'START':
+                        if in_question:  # Предыдущий вопрос не закрыт
+                            logger.warning(f"Вопрос не закрыт ---END---")
+                            self.save_current_question(current_question, text_buffer, questions)
                         
-                        for img_bytes in images:
-                            current_question['images'].append(img_bytes)
-                            text_buffer.append('[BILD]')
-                    else:
-                        # Если изображений нет, просто добавляем текст
-                        if text:
-                            text_buffer.append(text)
+                        in_question = True
+                        current_question = {'text': '', 'images': []}
+                        text_buffer = []
+                        continue
+                    
+                    # Проверяем конец вопроса
+                    if marker == 'END':
+                        if not in_question:
+                            logger.warning(f"Лишний ---END--- в параграфе {i+1}")
+                        else:
+                            self.save_current_question(current_question, text_buffer, questions)
+                        in_question = False
+                        continue
+                    
+                    if in_question:
+                        # Извлекаем изображения из параграфа
+                        images = self.extract_images_from_paragraph(
+                            paragraph, zf, rels, media, unique_images)
+                        
+                        # Если есть изображения, добавляем их в правильном порядке
+                        if images:
+                            # Для каждого изображения добавляем текст до него и само изображение
+                            # В этом упрощенном подходе мы добавляем весь текст параграфа, затем все изображения
+                            # Это может не сохранить точный порядок, если изображения внутри текста
+                            if text.strip():
+                                text_buffer.append(text)
+                            
+                            current_question['images'].extend(images)
+                            text_buffer.extend(['[BILD]'] * len(images))
+                        else:
+                            # Если изображений нет, просто добавляем текст
+                            if text:
+                                text_buffer.append(text)
             
-            # Обрабатываем последний вопрос, если он не закрыт
-            if in_question:
+            # Обрабатываем последний вопрос, если он не закрыт (и разбор не отменен)
+            if in_question and not current_thread.isInterruptionRequested():
                 logger.warning(f"Последний вопрос не закрыт ---END---")
                 self.save_current_question(current_question, text_buffer, questions)
             
@@ -2004,38 +2655,56 @@ class QuestionApp(QMainWindow):
         
         return questions
     
-    def extract_images_from_paragraph(self, paragraph, doc):
-        """Извлекает изображения из параграфа с улучшенной обработкой."""
+    def extract_images_from_paragraph(self, paragraph, zf, rels, media, unique_images=None):
+        """Извлекает изображения из параграфа с улучшенной обработкой.
+        
+        Картинка читается из архива zf при первой ссылке и запоминается в media
+        по пути. Если передан словарь unique_images, повторяющиеся по содержимому
+        картинки заменяются одним и тем же объектом bytes: кэши превью и экспорта,
+        работающие по id, тогда обрабатывают такую картинку один раз.
+        """
         images = []
         
         try:
-            # Ищем все элементы drawing
-            for element in paragraph._element.iter():
-                if element.tag.endswith('drawing'):
-                    # Ищем blip элементы
-                    for blip in element.findall('.//{*}blip'):
-                        rId = blip.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed')
-                        if rId and rId in doc.part.related_parts:
-                            try:
-                                image_part = doc.part.related_parts[rId]
-                                img_bytes = image_part.blob
-                                
-                                # Конвертируем изображение в PNG для гарантированной совместимости
-                                img = Image.open(io.BytesIO(img_bytes))
-                                
-                                # Определяем формат
-                                if img.format not in ['PNG', 'JPEG', 'GIF', 'BMP']:
-                                    # Конвертируем в PNG
-                                    png_buffer = io.BytesIO()
-                                    if img.mode not in ['RGB', 'RGBA']:
-                                        img = img.convert('RGB')
-                                    img.save(png_buffer, format='PNG', optimize=True)
-                                    img_bytes = png_buffer.getvalue()
-                                
-                                images.append(img_bytes)
-                                
-                            except Exception as e:
-                                logger.error(f"Ошибка обработки изображения {rId}: {e}")
+            # Ищем картинки (blip) во всех drawing абзаца одним XPath-запросом
+            for blip in _BLIP_XPATH(paragraph):
+                rId = blip.get(_EMBED_ATTR)
+                path = rels.get(rId) if rId else None
+                if path is None:
+                    continue
+                
+                img_bytes = media.get(path)
+                if img_bytes is None:
+                    try:
+                        img_bytes = zf.read(path)
+                        
+                        # PNG/JPEG/GIF/BMP узнаем по сигнатуре и берем как есть;
+                        # остальные форматы конвертируем в PNG для гарантированной совместимости
+                        if not img_bytes.startswith(_SUPPORTED_IMAGE_SIGNATURES):
+                            img = Image.open(io.BytesIO(img_bytes))
+                            
+                            # Определяем формат
+                            if img.format not in ['PNG', 'JPEG', 'GIF', 'BMP']:
+                                # Конвертируем в PNG
+                                png_buffer = io.BytesIO()
+                                if img.mode not in ['RGB', 'RGBA']:
+                                    img = img.convert('RGB')
+                                # Эти байты как есть попадают в DOCX (без повторного сжатия)
+                                # и в base64 HTML/JSON, поэтому размер важен: стандартный
+                                # уровень 6 сжимает почти как optimize, но без его перебора
+                                img.save(png_buffer, format='PNG')
+                                img_bytes = png_buffer.getvalue()
+                        
+                        if unique_images is not None:
+                            img_bytes = unique_images.setdefault(
+                                ImageCache.get_image_hash(img_bytes), img_bytes)
+                        media[path] = img_bytes
+                        
+                    except Exception as e:
+                        logger.error(f"Ошибка обработки изображения {rId}: {e}")
+                        continue
+                
+                images.append(img_bytes)
         
         except Exception as e:
             logger.error(f"Ошибка извлечения изображений: {e}")
@@ -2045,37 +2714,146 @@ class QuestionApp(QMainWindow):
     def save_current_question(self, current_question, text_buffer, questions):
         """Сохраняет текущий вопрос в список."""
         if text_buffer or current_question['images']:
+            # Запись вопроса собираем сразу, без копирования current_question
             question_text = '\n'.join(text_buffer)
-            current_question['text'] = question_text
-            questions.append(current_question.copy())
+            question = {
+                'text': question_text,
+                'images': current_question['images'],
+                '_parts': question_text.split('[BILD]'),
+            }
+            question_display_height(question)
+            questions.append(question)
     
     def create_question_widgets(self):
         """Создает виджеты вопросов."""
-        # Очищаем предыдущие виджеты
-        for widget in self.question_widgets:
-            widget.deleteLater()
-        self.question_widgets.clear()
+        # Пока виджеты прячутся, показываются и добавляются, layout отключен:
+        # раскладка пересчитывается один раз в конце, а не на каждый виджет
+        self.scroll_layout.setEnabled(False)
+        try:
+            self._fill_question_widgets()
+            # Введенный поиск применяем к новым вопросам сразу: если все виджеты
+            # взяты из пула, порционного создания (и фильтра в его конце) не будет
+            if self.search_edit.text():
+                self.filter_questions(self.search_edit.text())
+        finally:
+            self.scroll_layout.setEnabled(True)
+            self.scroll_layout.invalidate()
         
-        # Создаем обычные виджеты
-        for i, question_data in enumerate(self.questions):
-            widget = QuestionWidget(question_data, i, self.image_cache)
-            widget.checkbox.stateChanged.connect(self.update_counter)
+        # Обновляем счетчики
+        self.update_loaded_counter()
+        self.update_counter()
+        self.materialize_timer.start()
+    
+    def _fill_question_widgets(self):
+        """Привязывает виджеты из пула к self.questions; недостающие ставит в очередь."""
+        # Освобождаем предыдущие виджеты
+        self.release_question_widgets()
+        
+        # Индекс для поиска: тексты в нижнем регистре склеены через разделитель
+        # в одну строку, для каждого вопроса запомнено смещение его начала
+        texts = [q['text'].lower() for q in self.questions]
+        self._search_corpus = '\x01'.join(texts)
+        self._search_starts = list(accumulate((len(t) + 1 for t in texts), initial=0))[:-1]
+        # Видимость каждого вопроса после фильтра; новые виджеты показаны
+        self._question_visible = [True] * len(self.questions)
+        # Новые и переиспользованные виджеты не отмечены
+        self._check_bits = bytearray(len(self.questions))
+        
+        # Сначала переиспользуем виджеты из пула (они уже стоят в layout по порядку
+        # и подключены к обработчикам)
+        pool = self._widget_pool
+        reused = min(len(pool), len(self.questions))
+        for i in range(reused):
+            pool[i].reset(self.questions[i], i)
+        self.question_widgets = pool[:reused]
+        self._widget_pool = pool[reused:]
+        
+        # Содержимое строится по мере прокрутки
+        self._pending_widgets = list(self.question_widgets)
+        
+        # Недостающие виджеты создаются порциями
+        if reused < len(self.questions):
+            self.build_timer.start()
+    
+    def build_next_question_widgets(self):
+        """Создает очередную порцию виджетов вопросов."""
+        start = len(self.question_widgets)
+        end = min(start + self.WIDGET_CHUNK_SIZE, len(self.questions))
+        for i in range(start, end):
+            widget = QuestionWidget(self.questions[i], i, self.image_cache, lazy=True)
+            # Отметка, поставленная до создания виджета (выбрать все, случайные),
+            # уже лежит в _check_bits; счетчик ее учел, поэтому сигнал еще не подключен
+            if self._check_bits[i]:
+                widget.set_checked(True)
+            # Индекс берем у виджета при срабатывании: виджет из пула меняет его в reset()
+            widget.checkbox.stateChanged.connect(
+                lambda state, widget=widget: self.on_check_changed(widget.index, state))
             widget.connect_click_handler(self.on_question_clicked)
             self.question_widgets.append(widget)
+            self._pending_widgets.append(widget)
             self.scroll_layout.addWidget(widget)
         
-        # Обновляем счетчики
-        self.update_loaded_counter()
-        self.update_counter()
+        if end >= len(self.questions):
+            self.build_timer.stop()
+            # Фильтр, введенный во время создания, применяем и к новым виджетам
+            if self.search_edit.text():
+                self.filter_questions(self.search_edit.text())
+        self.materialize_timer.start()
+    
+    def materialize_visible_questions(self):
+        """Создает содержимое вопросов, попадающих в видимую область (с запасом)."""
+        if not self.scroll_area.isVisible():
+            return
+        # Координаты виджетов должны быть актуальными, а не нулевыми до раскладки
+        self.scroll_layout.activate()
+        # Область прокрутки еще не растянула содержимое под новые вопросы: раскладка
+        # сжата, и «видимыми» оказались бы почти все. Ждем rangeChanged
+        if self.scroll_content.height() < self.scroll_layout.minimumSize().height():
+            return
+        viewport_height = self.scroll_area.viewport().height()
+        top = self.scroll_area.verticalScrollBar().value() - viewport_height
+        bottom = top + viewport_height * 3
+        
+        # Просматриваем только еще не построенные вопросы; построенные выбывают
+        # из списка, поэтому повторная прокрутка по ним ничего не стоит
+        pending = self._pending_widgets
+        remaining = []
+        for pos, widget in enumerate(pending):
+            if widget.content_built:
+                continue
+            # Нулевая высота – раскладка еще не применена, дождемся rangeChanged
+            if not widget.isVisible() or not widget.height():
+                remaining.append(widget)
+                continue
+            y = widget.y()
+            if y > bottom:
+                remaining.extend(pending[pos:])
+                break
+            if y + widget.height() >= top:
+                # Картинки не из кэша ensure_content отдает в фоновый пул
+                widget.ensure_content()
+            else:
+                remaining.append(widget)
+        self._pending_widgets = remaining
+    
+    def release_question_widgets(self):
+        """Возвращает виджеты вопросов в пул вместо удаления."""
+        self.build_timer.stop()
+        for widget in self.question_widgets:
+            widget.release()
+        # Пул хранит виджеты в том же порядке, в каком они стоят в layout
+        self._widget_pool = self.question_widgets + self._widget_pool
+        self.question_widgets = []
+        self._pending_widgets = []
+        self._check_bits = bytearray()
     
     def clear_questions(self):
         """Очищает список вопросов."""
-        for widget in self.question_widgets:
-            widget.deleteLater()
-        self.question_widgets.clear()
+        self.release_question_widgets()
         
-        # Очищаем кэш изображений
-        self.image_cache.clear_cache()
+        # Кэш картинок по содержимому сохраняем: при повторной загрузке того же
+        # файла QPixmap берутся из него. Забываем только ссылки на старые байты
+        self.image_cache.forget_sources()
     
     def on_question_clicked(self, index):
         """Обработчик клика по виджету вопроса."""
@@ -2083,75 +2861,136 @@ class QuestionApp(QMainWindow):
             widget = self.question_widgets[index]
             widget.set_checked(not widget.is_checked())
     
+    def find_matching_questions(self, search_text):
+        """Возвращает флаги совпадения поиска для каждого вопроса.
+        
+        Вместо проверки каждого текста по отдельности идем str.find по общей
+        строке и переводим найденные смещения в номера вопросов через bisect.
+        """
+        starts = self._search_starts
+        matched = [False] * len(starts)
+        corpus = self._search_corpus
+        pos = corpus.find(search_text)
+        while pos != -1:
+            idx = bisect.bisect_right(starts, pos) - 1
+            matched[idx] = True
+            # Остальные вхождения в этом вопросе не важны – ищем со следующего
+            if idx + 1 >= len(starts):
+                break
+            pos = corpus.find(search_text, starts[idx + 1])
+        return matched
+    
     def filter_questions(self, text):
         """Фильтрует вопросы по тексту."""
-        if not text:
-            # Показываем все вопросы
-            for widget in self.question_widgets:
-                widget.show()
+        search_text = text.lower()
+        if search_text:
+            matched = self.find_matching_questions(search_text)
         else:
-            # Фильтруем вопросы
-            search_text = text.lower()
-            for i, widget in enumerate(self.question_widgets):
-                if i < len(self.questions):
-                    question_text = self.questions[i]['text'].lower()
-                    widget.setVisible(search_text in question_text)
+            matched = [True] * len(self.question_widgets)
+        
+        # Qt трогаем только у виджетов, чья видимость действительно меняется.
+        # Еще не созданные виджеты пропускаем: фильтр к ним применится после создания
+        visible = self._question_visible
+        with self.bulk_update(block_checks=False):
+            for i, (shown, widget) in enumerate(zip(matched, self.question_widgets)):
+                if shown != visible[i]:
+                    widget.setVisible(shown)
+                    visible[i] = shown
+        self.materialize_timer.start()
     
     def clear_search(self):
         """Очищает поле поиска."""
         self.search_edit.clear()
     
+    @contextmanager
+    def bulk_update(self, block_checks=True):
+        """Массовое изменение вопросов: список перерисовывается один раз в конце.
+        
+        С block_checks сигналы чекбоксов не идут в счетчик по одному –
+        вызывающий сам выставляет _check_bits, счетчик обновляется здесь.
+        """
+        self.scroll_content.setUpdatesEnabled(False)
+        blockers = [QSignalBlocker(w.checkbox) for w in self.question_widgets] if block_checks else []
+        try:
+            yield
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            self.scroll_content.setUpdatesEnabled(True)
+            if block_checks:
+                self.update_counter()
+    
     def select_all_questions(self):
         """Выбирает все вопросы."""
-        for widget in self.question_widgets:
-            widget.set_checked(True)
-        self.update_counter()
+        bits = self._check_bits
+        with self.bulk_update():
+            for i, widget in enumerate(self.question_widgets):
+                if not bits[i]:
+                    widget.set_checked(True)
+                    bits[i] = 1
+            # Еще не созданные виджеты возьмут отметку из _check_bits
+            built = len(self.question_widgets)
+            bits[built:] = b'\x01' * (len(bits) - built)
     
     def deselect_all_questions(self):
         """Снимает выделение со всех вопросов."""
-        for widget in self.question_widgets:
-            widget.set_checked(False)
+        bits = self._check_bits
+        with self.bulk_update():
+            for i, widget in enumerate(self.question_widgets):
+                if bits[i]:
+                    widget.set_checked(False)
+                    bits[i] = 0
+            built = len(self.question_widgets)
+            bits[built:] = bytes(len(bits) - built)
+    
+    def on_check_changed(self, index, state):
+        """Запоминает отметку одного вопроса и обновляет счетчик выбранных."""
+        self._check_bits[index] = state == Qt.Checked
         self.update_counter()
     
     def update_counter(self):
         """Обновляет счетчик выбранных вопросов."""
-        count = sum(1 for widget in self.question_widgets if widget.is_checked())
-        self.counter_label.setText(f"{self.ui_texts['selected']}: {count}")
+        # bytearray.count выполняется в C по непрерывному буферу
+        self.counter_label.setText(self._counter_fmt.format(self._check_bits.count(1)))
+    
+    def selected_questions(self):
+        """Возвращает отмеченные вопросы в порядке списка."""
+        return [question for question, bit in zip(self.questions, self._check_bits) if bit]
     
     def update_loaded_counter(self):
         """Обновляет счетчик загруженных вопросов."""
-        self.loaded_label.setText(f"{self.ui_texts['loaded']}: {len(self.questions)}")
+        self.loaded_label.setText(self._loaded_fmt.format(len(self.questions)))
     
     def random_select(self):
         """Выбирает случайные вопросы в заданном количестве."""
         count = self.random_spin.value()
+        total = len(self.questions)
         
-        if len(self.question_widgets) < count:
+        if total < count:
             QMessageBox.warning(
                 self, 
                 self.ui_texts['error_load'], 
-                self.ui_texts['less_than_count'].format(len(self.question_widgets), count)
+                self.ui_texts['less_than_count'].format(total, count)
             )
             return
         
-        # Сбрасываем все выборы
-        for widget in self.question_widgets:
-            widget.set_checked(False)
-        
-        # Выбираем случайные вопросы
-        indices = random.sample(range(len(self.question_widgets)), count)
-        for idx in indices:
-            self.question_widgets[idx].set_checked(True)
-        
-        self.update_counter()
+        # Выбираем случайные вопросы и меняем только те отметки, что отличаются:
+        # вопрос, попавший и в старую, и в новую выборку, не снимается и не ставится заново
+        chosen = set(random.sample(range(total), count))
+        bits = self._check_bits
+        with self.bulk_update():
+            for idx, widget in enumerate(self.question_widgets):
+                checked = idx in chosen
+                if bits[idx] != checked:
+                    widget.set_checked(checked)
+                    bits[idx] = checked
+            # Еще не созданные виджеты возьмут отметку из _check_bits
+            for idx in range(len(self.question_widgets), total):
+                bits[idx] = idx in chosen
     
     def save_selected(self):
         """Сохраняет выбранные вопросы в новый DOCX файл."""
-        selected_questions = [
-            self.questions[i]
-            for i, widget in enumerate(self.question_widgets)
-            if widget.is_checked()
-        ]
+        selected_questions = self.selected_questions()
         
         if not selected_questions:
             QMessageBox.warning(
@@ -2179,11 +3018,7 @@ class QuestionApp(QMainWindow):
     
     def show_export_dialog(self):
         """Показывает диалог экспорта."""
-        selected_questions = [
-            self.questions[i]
-            for i, widget in enumerate(self.question_widgets)
-            if widget.is_checked()
-        ]
+        selected_questions = self.selected_questions()
         
         if not selected_questions:
             QMessageBox.warning(
@@ -2236,14 +3071,15 @@ class QuestionApp(QMainWindow):
             progress.show()
             
             # Создаем и запускаем поток экспорта
-            self.export_worker = ExportWorker(questions, export_format, file_path, export_options)
-            self.export_worker.progress.connect(progress.setValue)
-            self.export_worker.finished.connect(
-                lambda path: self.on_export_finished(path, export_format)
+            worker = ExportWorker(questions, export_format, file_path, export_options)
+            self.export_worker = worker
+            worker.progress.connect(progress.setValue)
+            worker.finished.connect(
+                lambda path: self.on_export_finished(worker, progress, path, export_format)
             )
-            self.export_worker.error.connect(self.on_export_error)
+            worker.error.connect(lambda message: self.on_export_error(worker, progress, message))
             
-            self.export_worker.start()
+            worker.start()
             
         except Exception as e:
             logger.error(f"Ошибка начала экспорта: {str(e)}")
@@ -2253,16 +3089,33 @@ class QuestionApp(QMainWindow):
                 f"Не удалось начать экспорт:\n{str(e)}"
             )
     
-    def on_export_finished(self, file_path, export_format):
+    def release_export_worker(self, worker, progress):
+        """Освобождает завершившийся поток экспорта и его диалог.
+        
+        Иначе поток с вопросами и кэшами картинок жил бы до следующего экспорта,
+        а диалоги прогресса копились бы у окна.
+        """
+        progress.close()
+        progress.deleteLater()
+        # Сигнал отправлен из run(); дожидаемся выхода из потока перед удалением
+        worker.wait()
+        worker.questions = None
+        worker.deleteLater()
+        if self.export_worker is worker:
+            self.export_worker = None
+    
+    def on_export_finished(self, worker, progress, file_path, export_format):
         """Обработчик завершения экспорта."""
+        self.release_export_worker(worker, progress)
         QMessageBox.information(
             self,
             self.ui_texts['export_complete'],
             f"Экспорт в {export_format.upper()} завершен:\n{file_path}"
         )
     
-    def on_export_error(self, error_message):
+    def on_export_error(self, worker, progress, error_message):
         """Обработчик ошибки экспорта."""
+        self.release_export_worker(worker, progress)
         QMessageBox.critical(
             self,
             self.ui_texts['export_error'],